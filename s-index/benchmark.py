@@ -0,0 +1,225 @@
+import argparse
+import contextlib
+import copy
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+import scholar_scraper as scraper
+from mock_scholar import MockScholarServer
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+STAGES = ('fetch', 'soup', 'extract', 'parse_page', 'get_publications', 'find_undercited',
+          'print_sorted', 'print_undercited')
+
+
+def _available_parsers():
+    available = []
+    for parser in scraper.PARSERS:
+        try:
+            scraper._parse_page(b'<html></html>', parser)
+        except Exception:
+            continue
+        available.append(parser)
+    return available
+
+
+def _measure(fn, repeat):
+    """
+    Time a stage and measure its peak memory.
+
+    Memory is measured in a separate untimed run, so tracemalloc overhead
+    does not distort the timings.
+
+    Args:
+        fn (callable): Stage to run; called with no arguments
+        repeat (int): Number of timed runs
+
+    Returns:
+        dict: Dictionary with 'min_s', 'median_s', 'runs' and 'peak_bytes'
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'min_s': min(timings), 'median_s': statistics.median(timings), 'runs': repeat,
+            'peak_bytes': peak}
+
+
+def _build_tree(content, parser):
+    # Build the tree the way _parse_page does for a publications-only page
+    if parser == 'lxml-xpath':
+        return scraper.lxml_html.fromstring(content)
+    if parser in scraper._STRAINER_PARSERS:
+        return BeautifulSoup(content, parser, parse_only=scraper._PUBLICATIONS_STRAINER)
+    return BeautifulSoup(content, parser)
+
+
+def _extract_rows(root, parser):
+    if parser == 'lxml-xpath':
+        return scraper._parse_publication_rows_xpath(root)
+    return scraper._parse_publication_rows(root)
+
+
+def _fetch_pages(profile, size):
+    return [scraper._fetch(profile.page_url(start)) for start in range(0, max(size, 1),
+                                                                       scraper.PAGE_SIZE)]
+
+
+def bench_size(server, size, parsers, repeat, stages=STAGES):
+    """
+    Benchmark every stage for one profile size.
+
+    Args:
+        server (MockScholarServer): Running server the scraper is pointed at
+        size (int): Number of publications on the profile
+        parsers (list): Parser backends to benchmark
+        repeat (int): Timed runs per stage
+        stages (iterable): Stages to run, a subset of STAGES
+
+    Returns:
+        list: One result dictionary per stage (and parser, for parser
+            dependent stages) with timings, throughput and memory
+    """
+    user_id = f"bench{size}"
+    server.profiles[user_id] = size
+    profile = scraper.ProfileKey(user_id, 'en')
+    pages = _fetch_pages(profile, size)
+    total_bytes = sum(len(page) for page in pages)
+
+    results = []
+
+    def record(stage, fn, parser=None, items=size):
+        result = _measure(fn, repeat)
+        result.update({
+            'stage': stage,
+            'size': size,
+            'parser': parser,
+            'pages': len(pages),
+            'bytes': total_bytes,
+            'items_per_s': items / result['min_s'] if result['min_s'] else None,
+        })
+        results.append(result)
+        print(f"{stage:<17} {parser or '-':<12} {size:>6} pubs  "
+              f"{result['min_s'] * 1000:9.2f} ms  {result['peak_bytes'] / 1024:10.1f} KiB",
+              file=sys.stderr)
+
+    if 'fetch' in stages:
+        record('fetch', lambda: _fetch_pages(profile, size))
+
+    publications = None
+    for parser in parsers:
+        trees = [_build_tree(page, parser) for page in pages]
+        if 'soup' in stages:
+            record('soup', lambda: [_build_tree(page, parser) for page in pages], parser)
+        if 'extract' in stages:
+            record('extract', lambda: [_extract_rows(root, parser) for root in trees], parser)
+        if 'parse_page' in stages:
+            record('parse_page',
+                   lambda: [scraper._parse_page(page, parser, publications=True) for page in pages],
+                   parser)
+        if 'get_publications' in stages:
+            url = profile.profile_url()
+            record('get_publications', lambda: scraper.get_publications(url, parser=parser),
+                   parser)
+        if publications is None:
+            publications = [pub for root in trees for pub in _extract_rows(root, parser)]
+
+    # find_undercited_publications annotates its input, so each run gets a copy
+    if 'find_undercited' in stages:
+        copies = [copy.deepcopy(publications) for _ in range(repeat + 1)]
+        record('find_undercited',
+               lambda: scraper.find_undercited_publications(copies.pop()))
+
+    undercited = scraper.find_undercited_publications(copy.deepcopy(publications))
+
+    def quiet(fn, *args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn(*args)
+
+    if 'print_sorted' in stages:
+        record('print_sorted', lambda: quiet(scraper.print_publications_sorted, publications))
+    if 'print_undercited' in stages:
+        record('print_undercited',
+               lambda: quiet(scraper.print_undercited_publications, undercited),
+               items=len(undercited))
+
+    return results
+
+
+def run(sizes=DEFAULT_SIZES, parsers=None, repeat=5, stages=STAGES, latency=0.0):
+    """
+    Run the benchmark against a local mock Scholar server.
+
+    The scraper's caches, pacing and checkpointing are switched off for the
+    run so every stage does its full work each time.
+
+    Args:
+        sizes (iterable): Profile sizes in publications
+        parsers (list): Parser backends; defaults to every installed one
+        repeat (int): Timed runs per stage
+        stages (iterable): Stages to run, a subset of STAGES
+        latency (float): Latency the server adds to each response
+
+    Returns:
+        dict: Dictionary with 'environment' and 'results'
+    """
+    parsers = parsers or _available_parsers()
+    scraper.configure(cache=None, result_cache=None, rate_limiter=None, hedge_policy=None,
+                      checkpoint=None)
+
+    results = []
+    with MockScholarServer(latency=latency) as server:
+        scraper.configure(base_url=server.base_url)
+        for size in sizes:
+            results.extend(bench_size(server, size, parsers, repeat, stages))
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'parsers': parsers,
+            'repeat': repeat,
+            'latency': latency,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'results': results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scraper stages against a local "
+                                                 "mock Scholar server.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="profile sizes in publications")
+    parser.add_argument('--parsers', nargs='+', choices=scraper.PARSERS,
+                        help="parser backends (default: all installed)")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per stage")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="seconds the server adds to each response")
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help="JSON file to write the results to")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.parsers, args.repeat, args.stages, args.latency)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
@@ -0,0 +1,361 @@
+import argparse
+import hashlib
+import html
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Scholar serves 20 rows by default and at most 100 per request
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+CURRENT_YEAR = 2025
+
+_FIRST_NAMES = ['Ada', 'Alan', 'Barbara', 'Donald', 'Edsger', 'Frances', 'Grace', 'John',
+                'Leslie', 'Margaret', 'Niklaus', 'Radia', 'Tony', 'Shafi', 'Whitfield']
+_LAST_NAMES = ['Lovelace', 'Turing', 'Liskov', 'Knuth', 'Dijkstra', 'Allen', 'Hopper',
+               'McCarthy', 'Lamport', 'Hamilton', 'Wirth', 'Perlman', 'Hoare', 'Goldwasser',
+               'Diffie']
+_TOPICS = ['Model-Driven Engineering', 'Software Language Composition', 'Digital Twins',
+           'Variability Modeling', 'Cyber-Physical Systems', 'Robotics Software',
+           'Architecture Description Languages', 'Code Generation', 'Systems Engineering',
+           'Semantic Differencing']
+_VENUES = ['Software and Systems Modeling', 'MODELS', 'ICSE', 'Journal of Object Technology',
+           'SLE', 'ECMFA', 'IEEE Software', 'Modellierung', 'FSE', 'Automated Software Engineering']
+
+
+def _rng(user_id, seed):
+    digest = hashlib.sha256(f"{seed}:{user_id}".encode('utf-8')).digest()
+    return random.Random(int.from_bytes(digest[:8], 'big'))
+
+
+def generate_profile(user_id, num_publications, seed=0):
+    """
+    Generate a deterministic synthetic profile.
+
+    Args:
+        user_id (str): Google Scholar user ID
+        num_publications (int): Number of publications on the profile
+        seed (int): Seed mixed into the per-user random generator
+
+    Returns:
+        dict: Dictionary with 'name', 'metrics' (the six table values as
+            strings, in page order) and 'publications' (sorted by citations,
+            like the profile's default order)
+    """
+    rng = _rng(user_id, seed)
+
+    name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+
+    publications = []
+    for i in range(num_publications):
+        authors = ', '.join(f"{rng.choice(_FIRST_NAMES)[0]} {rng.choice(_LAST_NAMES)}"
+                            for _ in range(rng.randint(1, 5)))
+        year = rng.randint(CURRENT_YEAR - 30, CURRENT_YEAR)
+        publications.append({
+            'pub_id': f"{user_id}:{i:012d}",
+            'title': f"{rng.choice(_TOPICS)}: Study {i}",
+            'authors': authors,
+            'venue': f"{rng.choice(_VENUES)} {rng.randint(1, 60)}",
+            'year': str(year) if rng.random() > 0.02 else '',
+            # Heavy-tailed, like real citation counts; some papers are uncited
+            'citations': int(rng.paretovariate(1.2)) - 1 if rng.random() > 0.15 else 0,
+        })
+    publications.sort(key=lambda pub: pub['citations'], reverse=True)
+
+    citations = [pub['citations'] for pub in publications]
+    recent = [pub['citations'] // 3 for pub in publications]
+
+    def h_index(counts):
+        return sum(1 for rank, count in enumerate(sorted(counts, reverse=True), 1) if count >= rank)
+
+    def i10_index(counts):
+        return sum(1 for count in counts if count >= 10)
+
+    metrics = [sum(citations), sum(recent), h_index(citations), h_index(recent),
+               i10_index(citations), i10_index(recent)]
+
+    return {'name': name, 'metrics': [str(value) for value in metrics],
+            'publications': publications}
+
+
+def render_profile_page(profile, start=0, page_size=DEFAULT_PAGE_SIZE, lang='en'):
+    """
+    Render one publication page of a synthetic profile.
+
+    The markup follows the parts of a real profile page that the scraper
+    reads: the name header, the metrics table, the publication rows and
+    the "show more" button, which is disabled on the last page.
+
+    Args:
+        profile (dict): Profile as returned by generate_profile
+        start (int): Offset of the first publication on the page
+        page_size (int): Number of publications per page
+        lang (str): Language parameter echoed in links
+
+    Returns:
+        str: HTML of the page
+    """
+    publications = profile['publications']
+    page = publications[start:start + page_size]
+
+    rows = []
+    for pub in page:
+        user_id = pub['pub_id'].split(':')[0]
+        link = (f"/citations?view_op=view_citation&amp;hl={lang}&amp;user={user_id}"
+                f"&amp;citation_for_view={pub['pub_id']}")
+        venue_year = f"<span class=\"gs_oph\">, {pub['year']}</span>" if pub['year'] else ''
+        citations = pub['citations'] if pub['citations'] else ''
+        rows.append(
+            '<tr class="gsc_a_tr">'
+            f'<td class="gsc_a_t"><a href="{link}" class="gsc_a_at">{html.escape(pub["title"])}</a>'
+            f'<div class="gs_gray">{html.escape(pub["authors"])}</div>'
+            f'<div class="gs_gray">{html.escape(pub["venue"])}{venue_year}</div></td>'
+            f'<td class="gsc_a_c"><a href="#" class="gsc_a_ac gs_ibl">{citations}</a></td>'
+            f'<td class="gsc_a_y"><span class="gsc_a_h gsc_a_hc gs_ibl">{pub["year"]}</span></td>'
+            '</tr>')
+
+    metric_rows = []
+    labels = ['Citations', 'h-index', 'i10-index']
+    values = profile['metrics']
+    for i, label in enumerate(labels):
+        metric_rows.append(
+            f'<tr><td class="gsc_rsb_sc1"><a href="#" class="gsc_rsb_f gs_ibl">{label}</a></td>'
+            f'<td class="gsc_rsb_std">{values[2 * i]}</td>'
+            f'<td class="gsc_rsb_std">{values[2 * i + 1]}</td></tr>')
+
+    disabled = ' disabled=""' if start + page_size >= len(publications) else ''
+    shown_end = start + len(page)
+
+    return (
+        '<!doctype html><html><head><title>'
+        f'{html.escape(profile["name"])} - Google Scholar</title></head><body>'
+        '<div id="gsc_bdy"><div id="gsc_prf_w">'
+        f'<div id="gsc_prf_in">{html.escape(profile["name"])}</div>'
+        '<div class="gsc_prf_il">Synthetic University</div></div>'
+        '<div id="gsc_rsb"><table id="gsc_rsb_st"><thead><tr><th class="gsc_rsb_sth"></th>'
+        '<th class="gsc_rsb_sth">All</th><th class="gsc_rsb_sth">Since 2020</th></tr></thead>'
+        f'<tbody>{"".join(metric_rows)}</tbody></table></div>'
+        '<div id="gsc_art"><table id="gsc_a_t"><thead><tr id="gsc_a_trh">'
+        '<th class="gsc_a_t">Title</th><th class="gsc_a_c">Cited by</th>'
+        '<th class="gsc_a_y">Year</th></tr></thead>'
+        f'<tbody id="gsc_a_b">{"".join(rows)}</tbody></table>'
+        f'<div id="gsc_a_sp"><span id="gsc_a_nn">{start + 1 if page else 0}&ndash;{shown_end}</span>'
+        f'<button type="button" id="gsc_bpf_more"{disabled}>'
+        '<span class="gs_lbl">Show more</span></button></div></div></div>'
+        '</body></html>')
+
+
+class MockScholarServer:
+    """
+    Local stand-in for the Google Scholar citations endpoint.
+
+    Serves synthetic profiles at ``/citations?user=...`` with ``cstart``
+    and ``pagesize`` pagination, ETag revalidation, and optional injected
+    latency and errors. Point the scraper at it with
+    ``scholar_scraper.configure(base_url=server.base_url)``.
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind; 0 picks a free one
+        publications (int): Publications per profile
+        profiles (dict): Publication counts for specific user IDs,
+            overriding ``publications``
+        latency (float): Seconds added to every response
+        jitter (float): Extra latency drawn uniformly from [0, jitter]
+        error_rate (float): Fraction of requests answered with an error
+        error_status (int): Status of injected errors; 429 and 503 carry a
+            Retry-After header
+        retry_after (int): Value of that Retry-After header in seconds
+        seed (int): Seed for the synthetic profiles
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, publications=100, profiles=None, latency=0.0,
+                 jitter=0.0, error_rate=0.0, error_status=503, retry_after=1, seed=0):
+        self.publications = publications
+        self.profiles = dict(profiles or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.seed = seed
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._cache = {}
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/citations"
+
+    def profile(self, user_id):
+        """Return the synthetic profile of a user, generating it once."""
+        with self._lock:
+            if user_id not in self._cache:
+                count = self.profiles.get(user_id, self.publications)
+                self._cache[user_id] = generate_profile(user_id, count, self.seed)
+            return self._cache[user_id]
+
+    def _next_request(self):
+        # Decide delay and failure up front, under the lock, so concurrent
+        # requests draw from one reproducible random sequence
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay, failed
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without this, Nagle
+            # and delayed ACKs add ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                delay, failed = server._next_request()
+                if delay:
+                    time.sleep(delay)
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                user_id = query.get('user', [''])[0]
+
+                if url.path != '/citations' or not user_id:
+                    self._send(404, b'Not Found', 'text/plain')
+                    return
+                if failed:
+                    headers = {}
+                    if server.error_status in (429, 503):
+                        headers['Retry-After'] = str(server.retry_after)
+                    self._send(server.error_status, b'Injected error', 'text/plain', headers)
+                    return
+
+                try:
+                    start = max(0, int(query.get('cstart', ['0'])[0]))
+                    page_size = int(query.get('pagesize', [str(DEFAULT_PAGE_SIZE)])[0])
+                except ValueError:
+                    self._send(400, b'Bad Request', 'text/plain')
+                    return
+                page_size = max(1, min(MAX_PAGE_SIZE, page_size))
+                lang = query.get('hl', ['en'])[0]
+
+                body = render_profile_page(server.profile(user_id), start, page_size,
+                                           html.escape(lang)).encode('utf-8')
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    self._send(304, b'', None, {'ETag': etag})
+                    return
+                self._send(200, body, 'text/html; charset=utf-8', {'ETag': etag})
+
+            def _send(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header('Content-Type', content_type)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up, e.g. a cancelled hedge or timeout
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Serve requests on a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def write_fixtures(directory, sizes=(10, 100, 1000, 10000), page_size=MAX_PAGE_SIZE, seed=0):
+    """
+    Write the pages of synthetic profiles as HTML fixture files.
+
+    Args:
+        directory (str): Output directory
+        sizes (iterable): Publication counts, one profile each
+        page_size (int): Publications per page file
+        seed (int): Seed for the synthetic profiles
+
+    Returns:
+        dict: Publication count -> list of written file paths, in page order
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = {}
+    for size in sizes:
+        user_id = f"fixture{size}"
+        profile = generate_profile(user_id, size, seed)
+        paths = []
+        for start in range(0, max(size, 1), page_size):
+            path = os.path.join(directory, f"{user_id}_cstart{start}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(render_profile_page(profile, start, page_size))
+            paths.append(path)
+        written[size] = paths
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve synthetic Google Scholar profile pages.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--publications', type=int, default=100,
+                        help="publications per profile")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added per response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="random extra latency in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="fraction of requests answered with an error")
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--write-fixtures', metavar='DIR',
+                        help="write fixture pages to DIR instead of serving")
+    args = parser.parse_args()
+
+    if args.write_fixtures:
+        for size, paths in write_fixtures(args.write_fixtures, seed=args.seed).items():
+            print(f"{size} publications: {len(paths)} page(s)")
+    else:
+        server = MockScholarServer(args.host, args.port, args.publications, latency=args.latency,
+                                   jitter=args.jitter, error_rate=args.error_rate,
+                                   error_status=args.error_status, seed=args.seed)
+        print(f"Serving synthetic profiles at {server.base_url}?user=<any id>")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,51 +1,2037 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import argparse
+import asyncio
+import bisect
+import contextlib
+import contextvars
+import copy
+import cProfile
+import email.utils
+import functools
+import hashlib
+import json
+import os
+import pstats
+import random
 import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-def get_h_index(scholar_url):
+try:
+    import aiohttp
+except ImportError:  # only needed for the async API
+    aiohttp = None
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # only needed for the 'lxml-xpath' parser backend
+    lxml_html = None
+
+try:
+    import pyinstrument
+except ImportError:  # only needed for --profile with the sampling profiler
+    pyinstrument = None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+SCHOLAR_CITATIONS_URL = "https://scholar.google.de/citations"
+
+PAGE_SIZE = 100
+
+# Parser backends: the BeautifulSoup tree builders, plus 'lxml-xpath' which
+# extracts directly from an lxml tree without building a soup
+PARSERS = ('html.parser', 'lxml', 'html5lib', 'lxml-xpath')
+DEFAULT_PARSER = 'html.parser'
+
+# Restrict soup construction to the nodes the extractors read. html5lib
+# does not support parse_only and always builds the full tree.
+_STRAINER_PARSERS = ('html.parser', 'lxml')
+_METRICS_STRAINER = SoupStrainer(id=['gsc_rsb_st', 'gsc_prf_in'])
+# The publications table body holding the 'gsc_a_tr' rows, and the "show
+# more" button whose disabled state marks the last page
+_PUBLICATIONS_STRAINER = SoupStrainer(id=['gsc_a_b', 'gsc_bpf_more'])
+_PROFILE_STRAINER = SoupStrainer(id=['gsc_rsb_st', 'gsc_prf_in', 'gsc_a_b', 'gsc_bpf_more'])
+
+# Default (connect, read) timeouts in seconds for every request
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+
+# Connection pool sizing for the shared session: one pool per host, with
+# enough connections for concurrent page fetches against the same host
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 32
+
+# Histogram bucket bounds, in seconds, for every ``*_seconds`` series
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_UNSET = object()
+
+
+def _make_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session():
+    """
+    Return the shared keep-alive session used for all requests.
+    
+    Returns:
+        requests.Session: The configured session, created on first use
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _make_session()
+    return _session
+
+
+def configure(session=_UNSET, base_url=_UNSET, cache=_UNSET, result_cache=_UNSET,
+              rate_limiter=_UNSET, retry_policy=_UNSET, timeout=_UNSET, hedge_policy=_UNSET,
+              checkpoint=_UNSET, metrics=_UNSET, tracer=_UNSET):
+    """
+    Configure the fetch layer shared by all scraping functions.
+    
+    Arguments that are not passed keep their current value.
+    
+    Args:
+        session (requests.Session): Session reused by every fetch; None
+            restores the default pooled session
+        base_url (str): Citations endpoint used to build page URLs, e.g. a
+            local stand-in server instead of Google Scholar
+        cache (DiskCache): HTTP response cache consulted by every fetch;
+            None disables caching
+        result_cache (ResultCache): In-process cache of parsed results;
+            None disables it
+        rate_limiter (RateLimiter): Per-host pacing applied to every request;
+            None disables pacing. Defaults to RateLimiter(), i.e. 2
+            requests per second per host with bursts of 5.
+        retry_policy (RetryPolicy): Retries for transient page fetch
+            failures; None makes a single attempt per page. Defaults to
+            RetryPolicy(), i.e. up to 3 attempts with jittered backoff.
+        timeout (tuple): (connect, read) timeouts in seconds; None waits
+            indefinitely
+        hedge_policy (HedgePolicy): Hedging of slow publication page
+            requests; None (the default) never sends duplicates
+        checkpoint (CrawlCheckpoint): Store that lets interrupted
+            publication crawls resume; None disables checkpointing
+        metrics (MetricsRegistry): Registry receiving request, cache, parse
+            and analysis measurements; None (the default) records nothing
+        tracer (Tracer): Tracer receiving spans for calls, pages, fetches
+            and request attempts; None (the default) records no spans
+    """
+    global _session, _cache, _result_cache, _rate_limiter, _retry_policy, _timeout, _hedge_policy
+    global _checkpoint, _metrics, _tracer
+    global SCHOLAR_CITATIONS_URL
+    if session is not _UNSET:
+        with _session_lock:
+            _session = session
+    if base_url is not _UNSET:
+        SCHOLAR_CITATIONS_URL = base_url
+    if cache is not _UNSET:
+        _cache = cache
+    if result_cache is not _UNSET:
+        _result_cache = result_cache
+    if rate_limiter is not _UNSET:
+        _rate_limiter = rate_limiter
+    if retry_policy is not _UNSET:
+        _retry_policy = retry_policy
+    if timeout is not _UNSET:
+        _timeout = timeout
+    if hedge_policy is not _UNSET:
+        _hedge_policy = hedge_policy
+    if checkpoint is not _UNSET:
+        _checkpoint = checkpoint
+    if metrics is not _UNSET:
+        _metrics = metrics
+    if tracer is not _UNSET:
+        _tracer = tracer
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a crawl runs out of its deadline budget."""
+
+
+class PublicationList(list):
+    """
+    List of publications that also tells how it was produced.
+    
+    Attributes:
+        partial (bool): True if the deadline ran out before the last page,
+            so only the publications of the pages fetched so far are listed
+        parser (str): HTML parser backend the publications were parsed with
+    """
+    
+    partial = False
+    parser = None
+
+
+def _deadline_at(deadline):
+    return time.monotonic() + deadline if deadline is not None else None
+
+
+def _check_deadline(deadline_at, delay=0.0):
+    """
+    Return the seconds left before the deadline, or None without one.
+    
+    Raises:
+        DeadlineExceeded: If the deadline passes within ``delay`` seconds
+    """
+    if deadline_at is None:
+        return None
+    remaining = deadline_at - time.monotonic()
+    if remaining <= delay:
+        raise DeadlineExceeded("Deadline exceeded")
+    return remaining
+
+
+class MetricsRegistry:
+    """
+    Counters and timings recorded by the scraping and analysis functions.
+    
+    Install one with ``configure(metrics=MetricsRegistry())``. Series are
+    identified by a name plus keyword labels, e.g. ``parse_seconds`` with
+    ``parser='lxml'``. The scraper records:
+    
+    - ``requests`` (counter, by ``status``) and ``request_seconds``
+      (observation, by ``status``): every HTTP attempt, including hedged
+      duplicates, with 'error' as the status of connection failures and
+      timeouts
+    - ``bytes_downloaded`` (counter): response bodies received, including
+      those of retried attempts and hedged duplicates
+    - ``hedges`` (counter): duplicate requests sent by the HedgePolicy
+    - ``retries`` (counter, by ``reason``) and ``throttle_events``
+      (counter, by ``status``)
+    - ``cache_hits`` / ``cache_misses`` (counters, by ``cache``: 'http' or
+      'result') and ``cache_revalidations`` (counter): HTTP cache entries
+      confirmed by a 304
+    - ``parse_seconds`` and ``rows_per_page`` (observations, by ``parser``)
+    - ``operation_seconds`` (observation, by ``operation``): calls of the
+      public scraping and analysis functions
+    - ``pages_fetched`` (counter, by ``source``: 'network', 'revalidated'
+      or 'cache')
+    - ``profiles_scraped`` (counter, by ``status``: 'ok' or 'error'):
+      results returned by scrape_profile and async_scrape_profile
+    - ``queue_depth`` (gauge): profiles submitted to a batch that have not
+      started yet
+    
+    Observations of ``*_seconds`` series are also counted into histogram
+    buckets (see LATENCY_BUCKETS).
+    
+    Listeners added with add_listener are called synchronously, from the
+    thread doing the work, as ``callback(kind, name, value, labels)`` with
+    kind 'counter', 'gauge' or 'observation'.
+    
+    Args:
+        buckets (tuple): Ascending upper bounds of the histogram buckets
+    """
+    
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._observations = {}
+        self._listeners = []
+    
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+    
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+    
+    def increment(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        for callback in self._listeners:
+            callback('counter', name, value, labels)
+    
+    def adjust(self, name, delta, **labels):
+        """Move a gauge up or down by ``delta``."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + delta
+        for callback in self._listeners:
+            callback('gauge', name, delta, labels)
+    
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            summary = self._observations.get(key)
+            if summary is None:
+                summary = self._observations[key] = {'count': 0, 'sum': 0.0, 'min': value,
+                                                     'max': value}
+                if name.endswith('_seconds'):
+                    summary['buckets'] = [0] * len(self.buckets)
+            summary['count'] += 1
+            summary['sum'] += value
+            summary['min'] = min(summary['min'], value)
+            summary['max'] = max(summary['max'], value)
+            if 'buckets' in summary:
+                index = bisect.bisect_left(self.buckets, value)
+                if index < len(self.buckets):
+                    summary['buckets'][index] += 1
+        for callback in self._listeners:
+            callback('observation', name, value, labels)
+    
+    def counter(self, name, **labels):
+        """Return the value of a counter, summed over all labels not given."""
+        with self._lock:
+            return sum(value for (key_name, key_labels), value in self._counters.items()
+                       if key_name == name and labels.items() <= dict(key_labels).items())
+    
+    def summary(self, name, **labels):
+        """
+        Summarize the observations of a series.
+        
+        Args:
+            name (str): Series name
+            **labels: Labels to match; series with other values are skipped
+            
+        Returns:
+            dict: Dictionary with 'count', 'sum', 'min', 'max' and 'mean'
+                over all matching series
+        """
+        with self._lock:
+            matching = [summary for (key_name, key_labels), summary in self._observations.items()
+                        if key_name == name and labels.items() <= dict(key_labels).items()]
+        
+        count = sum(summary['count'] for summary in matching)
+        total = sum(summary['sum'] for summary in matching)
+        return {
+            'count': count,
+            'sum': total,
+            'min': min((summary['min'] for summary in matching), default=None),
+            'max': max((summary['max'] for summary in matching), default=None),
+            'mean': total / count if count else None,
+        }
+    
+    def snapshot(self):
+        """
+        Return a copy of every series.
+        
+        Returns:
+            dict: Dictionary with 'counters' and 'gauges' (value per series)
+                and 'observations' (count, sum, min, max and, for
+                ``*_seconds`` series, per-bucket counts matching
+                ``buckets``), keyed by (name, sorted label pairs)
+        """
+        with self._lock:
+            observations = {}
+            for key, summary in self._observations.items():
+                observations[key] = dict(summary)
+                if 'buckets' in summary:
+                    observations[key]['buckets'] = list(summary['buckets'])
+            return {'counters': dict(self._counters), 'gauges': dict(self._gauges),
+                    'observations': observations}
+    
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._observations.clear()
+
+
+def _increment(name, value=1, **labels):
+    metrics = _metrics
+    if metrics is not None:
+        metrics.increment(name, value, **labels)
+
+
+def _observe(name, value, **labels):
+    metrics = _metrics
+    if metrics is not None:
+        metrics.observe(name, value, **labels)
+
+
+def _adjust(name, delta, **labels):
+    metrics = _metrics
+    if metrics is not None:
+        metrics.adjust(name, delta, **labels)
+
+
+def _instrumented(operation, counter=None):
+    """
+    Record the duration of each call under ``operation_seconds``.
+    
+    With ``counter``, each returned result is also counted under that name,
+    with status 'error' for error dicts and 'ok' otherwise.
+    """
+    def finish(started, result):
+        _observe('operation_seconds', time.perf_counter() - started, operation=operation)
+        if counter is not None:
+            failed = isinstance(result, dict) and "error" in result
+            _increment(counter, status='error' if failed else 'ok')
+    
+    def decorate(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                result = None
+                try:
+                    with _span(operation):
+                        result = await fn(*args, **kwargs)
+                    return result
+                finally:
+                    finish(started, result)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                result = None
+                try:
+                    with _span(operation):
+                        result = fn(*args, **kwargs)
+                    return result
+                finally:
+                    finish(started, result)
+        return wrapper
+    return decorate
+
+
+def _prometheus_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ''
+    pairs = []
+    for name, value in labels:
+        value = _prometheus_value(value)
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class PrometheusExporter:
+    """
+    Serve a MetricsRegistry in the Prometheus text format.
+    
+    Counters are exported as ``<prefix>_<name>_total``, ``*_seconds``
+    observations as histograms and other observations as summaries. Two
+    gauges are derived at scrape time: ``<prefix>_cache_hit_ratio`` per
+    cache and ``<prefix>_profiles_per_minute`` over the last minute.
+    
+    Example:
+        metrics = MetricsRegistry()
+        configure(metrics=metrics)
+        PrometheusExporter(metrics, port=9108).start()
+    
+    Args:
+        registry (MetricsRegistry): Registry to export
+        host (str): Interface to bind; keep the default unless the endpoint
+            should be reachable from other machines
+        port (int): Port to bind; 0 picks a free one
+        prefix (str): Prefix of every metric name
+    """
+    
+    def __init__(self, registry, host='127.0.0.1', port=9108, prefix='scholar'):
+        self.registry = registry
+        self.prefix = prefix
+        self._profiles_lock = threading.Lock()
+        self._profile_times = deque()
+        self._thread = None
+        registry.add_listener(self._on_metric)
+        
+        exporter = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if urlparse(self.path).path != '/metrics':
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+    
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+    
+    def _on_metric(self, kind, name, value, labels):
+        if kind == 'counter' and name == 'profiles_scraped':
+            with self._profiles_lock:
+                self._profile_times.append(time.monotonic())
+    
+    def profiles_per_minute(self):
+        cutoff = time.monotonic() - 60
+        with self._profiles_lock:
+            while self._profile_times and self._profile_times[0] < cutoff:
+                self._profile_times.popleft()
+            return len(self._profile_times)
+    
+    def render(self):
+        """Return the current metrics in the Prometheus text format."""
+        snapshot = self.registry.snapshot()
+        lines = []
+        
+        def family(name, kind, samples):
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                labels = _prometheus_labels(labels)
+                lines.append(f"{name}{suffix}{labels} {_prometheus_value(value)}")
+        
+        def grouped(series):
+            groups = {}
+            for (name, labels), value in sorted(series.items(), key=lambda item: repr(item[0])):
+                groups.setdefault(name, []).append((labels, value))
+            return groups.items()
+        
+        for name, series in grouped(snapshot['counters']):
+            family(f"{self.prefix}_{name}_total", 'counter',
+                   [('', labels, value) for labels, value in series])
+        
+        for name, series in grouped(snapshot['gauges']):
+            family(f"{self.prefix}_{name}", 'gauge',
+                   [('', labels, value) for labels, value in series])
+        
+        for name, series in grouped(snapshot['observations']):
+            samples = []
+            for labels, summary in series:
+                if 'buckets' in summary:
+                    cumulative = 0
+                    for bound, count in zip(self.registry.buckets, summary['buckets']):
+                        cumulative += count
+                        samples.append(('_bucket', labels + (('le', bound),), cumulative))
+                    samples.append(('_bucket', labels + (('le', float('inf')),), summary['count']))
+                samples.append(('_sum', labels, summary['sum']))
+                samples.append(('_count', labels, summary['count']))
+            kind = 'histogram' if any('buckets' in summary for _, summary in series) else 'summary'
+            family(f"{self.prefix}_{name}", kind, samples)
+        
+        ratios = []
+        caches = {dict(labels).get('cache') for name, labels in snapshot['counters']
+                  if name in ('cache_hits', 'cache_misses')}
+        for cache in sorted(caches - {None}):
+            hits = self.registry.counter('cache_hits', cache=cache)
+            misses = self.registry.counter('cache_misses', cache=cache)
+            if hits + misses:
+                ratios.append(('', (('cache', cache),), hits / (hits + misses)))
+        if ratios:
+            family(f"{self.prefix}_cache_hit_ratio", 'gauge', ratios)
+        
+        family(f"{self.prefix}_profiles_per_minute", 'gauge',
+               [('', (), self.profiles_per_minute())])
+        
+        return '\n'.join(lines) + '\n'
+    
+    def start(self):
+        """Serve ``/metrics`` on a background thread and return its URL."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+    
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+_current_span = contextvars.ContextVar('scholar_scraper_span', default=None)
+
+
+class Span:
+    """
+    One timed step of a scrape, e.g. a page fetch or a request attempt.
+    
+    Attributes:
+        name (str): What the span measures
+        trace_id (str): Shared by every span of one top-level call
+        span_id (str): Unique ID of the span
+        parent_id (str): ID of the enclosing span, or None for a root span
+        attributes (dict): Details such as the page offset or HTTP status
+    """
+    
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = dict(attributes or {})
+        self.thread = threading.current_thread().name
+        self.start = time.time()
+        self._started = time.perf_counter()
+        self.duration = None
+        self.error = None
+    
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+    
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'duration': self.duration,
+            'thread': self.thread,
+            'status': 'error' if self.error is not None else 'ok',
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+
+class _NullSpan:
+    """Stands in for a Span while tracing is off."""
+    
+    def set_attribute(self, key, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class JsonlSpanExporter:
+    """
+    Append finished spans to a file, one JSON object per line.
+    
+    Spans are written when they end, so children precede their parents;
+    sort by 'start' to read a trace as a timeline.
+    
+    Args:
+        path (str): File to append to
+    """
+    
+    def __init__(self, path='scholar_traces.jsonl'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    def export(self, span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+    
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """
+    Record nested spans and hand each finished one to an exporter.
+    
+    The current span is kept in a context variable, so spans nest across
+    ``await`` and, for the worker pools used by the scraper, across threads.
+    
+    Example:
+        configure(tracer=Tracer(JsonlSpanExporter('trace.jsonl')))
+    
+    Args:
+        exporter: Object with an ``export(span)`` method
+    """
+    
+    def __init__(self, exporter):
+        self.exporter = exporter
+    
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        span = Span(name, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.duration = time.perf_counter() - span._started
+            self.exporter.export(span)
+
+
+@contextlib.contextmanager
+def _span(name, **attributes):
+    tracer = _tracer
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+    with tracer.span(name, **attributes) as span:
+        yield span
+
+
+def _submit(executor, fn, *args):
+    # Run in a copy of the caller's context so spans keep their parent
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+class ProfileKey(namedtuple('ProfileKey', ['user_id', 'lang'])):
+    """
+    Canonical identity of a Google Scholar profile.
+    
+    Every spelling of a profile URL (other Scholar hosts, parameter order,
+    extra parameters such as ``oi=ao``) parses to the same key, and all page
+    URLs are built from the key, so equivalent inputs share fetches, cache
+    entries and batch work.
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_url(cls, scholar_url):
+        """
+        Parse a profile URL.
+        
+        Args:
+            scholar_url (str): URL of the Google Scholar profile page; a
+                ProfileKey is returned unchanged
+            
+        Returns:
+            ProfileKey: The canonical key
+            
+        Raises:
+            ValueError: If the URL is not a string or has no user ID
+        """
+        if isinstance(scholar_url, cls):
+            return scholar_url
+        if not isinstance(scholar_url, str):
+            raise ValueError("Could not extract user ID from URL")
+        
+        query = dict(parse_qsl(urlparse(scholar_url).query))
+        user_id = query.get('user', '').strip()
+        if not user_id:
+            raise ValueError("Could not extract user ID from URL")
+        
+        # Get language parameter if present
+        lang = query.get('hl', '').strip().lower() or 'en'
+        
+        return cls(user_id, lang)
+    
+    def profile_url(self):
+        return f"{SCHOLAR_CITATIONS_URL}?{urlencode({'user': self.user_id, 'hl': self.lang})}"
+    
+    def page_url(self, start, page_size=PAGE_SIZE):
+        query = urlencode({'user': self.user_id, 'hl': self.lang, 'cstart': start,
+                           'pagesize': page_size})
+        return f"{SCHOLAR_CITATIONS_URL}?{query}"
+
+
+def _profile_key(scholar_url):
+    try:
+        return ProfileKey.from_url(scholar_url)
+    except ValueError:
+        return None
+
+
+def _normalize_url(url):
+    # Lower-case scheme and host and sort the query, so that equivalent
+    # spellings of the same page share a cache entry
+    parts = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', '', query, ''))
+
+
+class DiskCache:
+    """
+    On-disk HTTP response cache with conditional revalidation.
+    
+    Each entry stores the response body next to a small JSON file with its
+    ETag and Last-Modified validators. Entries younger than ``ttl`` are
+    served without a request; older ones are revalidated with a
+    conditional request and reused on 304 Not Modified.
+    
+    Args:
+        directory (str): Directory holding the cache files
+        ttl (float): Seconds an entry is served without revalidation
+    """
+    
+    def __init__(self, directory='~/.cache/scholar_scraper', ttl=3600):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        os.makedirs(self.directory, exist_ok=True)
+    
+    def _path(self, url, suffix):
+        key = hashlib.sha256(_normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+    
+    def _write(self, path, data):
+        # Write to a temporary file first so readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def get(self, url):
+        """
+        Look up the cached response for a URL.
+        
+        Args:
+            url (str): Requested URL
+            
+        Returns:
+            dict: Entry with 'content', 'etag', 'last_modified' and
+                'stored_at', or None if the URL is not cached
+        """
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(self._path(url, '.body'), 'rb') as f:
+                entry['content'] = f.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+    
+    def is_fresh(self, entry):
+        return time.time() - entry['stored_at'] < self.ttl
+    
+    def put(self, url, content, etag=None, last_modified=None):
+        """
+        Store a response body and its validators.
+        
+        Args:
+            url (str): Requested URL
+            content (bytes): Response body
+            etag (str): ETag response header, if any
+            last_modified (str): Last-Modified response header, if any
+        """
+        self._write(self._path(url, '.body'), content)
+        self._write_meta(url, {'url': _normalize_url(url), 'etag': etag,
+                               'last_modified': last_modified})
+    
+    def touch(self, url, entry):
+        """Restart the TTL of an entry after a 304 Not Modified."""
+        self._write_meta(url, {key: entry[key] for key in ('url', 'etag', 'last_modified')})
+    
+    def _write_meta(self, url, meta):
+        meta['stored_at'] = time.time()
+        self._write(self._path(url, '.json'), json.dumps(meta).encode('utf-8'))
+
+
+class ResultCache:
+    """
+    Bounded in-process LRU cache of parsed scrape results with per-entry TTL.
+    
+    Args:
+        maxsize (int): Maximum number of entries; the least recently used
+            entry is evicted beyond that
+        ttl (float): Seconds an entry stays valid
+    """
+    
+    def __init__(self, maxsize=1024, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Look up a cached result.
+        
+        Args:
+            key (tuple): Cache key
+            
+        Returns:
+            The cached value, or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """
+        Report cache effectiveness.
+        
+        Returns:
+            dict: 'hits', 'misses', 'evictions', 'size' and 'hit_ratio'
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+
+def _lookup_result(kind, scholar_url, parser):
+    """
+    Look up a parsed result in the configured result cache.
+    
+    Args:
+        kind (str): 'metrics', 'publications' or 'profile'
+        scholar_url (str): URL of the Google Scholar profile page
+        parser (str): Parser backend; results record it, so each backend
+            has its own entries
+        
+    Returns:
+        tuple: (cache key or None, copy of the cached result or None)
+    """
+    cache = _result_cache
+    profile = _profile_key(scholar_url) if cache is not None else None
+    if profile is None:
+        return None, None
+    
+    key = (kind, profile, parser)
+    cached = cache.get(key)
+    _increment('cache_hits' if cached is not None else 'cache_misses', cache='result')
+    # Callers may modify results (find_undercited_publications adds 'age')
+    return key, copy.deepcopy(cached) if cached is not None else None
+
+
+def _store_result(key, result):
+    cache = _result_cache
+    # Errors and deadline-truncated crawls are not worth keeping
+    incomplete = (isinstance(result, dict) and ("error" in result or result.get('partial'))
+                  or getattr(result, 'partial', False))
+    if key is not None and cache is not None and not incomplete:
+        cache.put(key, copy.deepcopy(result))
+    return result
+
+
+class CrawlCheckpoint:
+    """
+    SQLite store of completed publication pages for resumable crawls.
+    
+    Every completed page of an unfinished crawl is saved with its offset.
+    A retried or restarted crawl of the same profile replays the saved
+    pages and continues with the next offset; the checkpoint is removed
+    once the last page has been fetched.
+    
+    Args:
+        path (str): SQLite database file
+        max_age (float): Seconds after which a checkpoint is considered
+            stale and the crawl starts over
+    """
+    
+    def __init__(self, path='scholar_checkpoints.sqlite3', max_age=86400):
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint_pages ("
+                " user_id TEXT, lang TEXT, page_size INTEGER, start INTEGER,"
+                " metrics TEXT, publications TEXT, saved_at REAL,"
+                " PRIMARY KEY (user_id, lang, page_size, start))")
+    
+    @contextlib.contextmanager
+    def _connect(self):
+        # One short-lived connection per call keeps the store usable from
+        # any thread; ``with conn`` only commits, closing() closes it
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            with conn:
+                yield conn
+    
+    def load(self, profile, page_size=PAGE_SIZE):
+        """
+        Return the saved pages of an unfinished crawl.
+        
+        Args:
+            profile (ProfileKey): Profile being crawled
+            page_size (int): Page size of the crawl
+            
+        Returns:
+            list: (start, metrics dict or None, publications list) per saved
+                page, in order; empty if there is no usable checkpoint
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT start, metrics, publications, saved_at FROM checkpoint_pages"
+                " WHERE user_id = ? AND lang = ? AND page_size = ? ORDER BY start",
+                (profile.user_id, profile.lang, page_size)).fetchall()
+        
+        if not rows or time.time() - max(row[3] for row in rows) > self.max_age:
+            if rows:
+                self.clear(profile)
+            return []
+        
+        pages = []
+        for start, metrics, publications, _ in rows:
+            # Only a gapless run of pages from offset 0 can be resumed
+            if start != len(pages) * page_size:
+                break
+            pages.append((start, json.loads(metrics) if metrics else None,
+                          json.loads(publications)))
+        return pages
+    
+    def save(self, profile, page_size, start, metrics, publications):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoint_pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (profile.user_id, profile.lang, page_size, start,
+                 json.dumps(metrics) if metrics is not None else None,
+                 json.dumps(publications), time.time()))
+    
+    def clear(self, profile):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoint_pages WHERE user_id = ? AND lang = ?",
+                         (profile.user_id, profile.lang))
+
+
+def _outlasts(deadline_at, other):
+    # Whether a deadline (None meaning none) is no earlier than another
+    return deadline_at is None or (other is not None and deadline_at >= other)
+
+
+class _SingleFlight:
+    """
+    Let concurrent callers asking for the same key share one call.
+    
+    The first caller runs the call; callers arriving while it is in flight
+    wait for it and receive deep copies of its result (or its exception).
+    A caller only joins a call whose deadline (a time.monotonic() value,
+    None for none) is no earlier than its own, since a call cut short by
+    its deadline returns a partial result; otherwise it runs its own.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+    
+    def do(self, key, fn, deadline_at=None):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                # [future, number of waiting callers, deadline]
+                call = self._calls[key] = [Future(), 0, deadline_at]
+            elif _outlasts(call[2], deadline_at):
+                call[1] += 1
+            else:
+                call = None
+        
+        if call is None:
+            return fn()
+        if not leader:
+            return copy.deepcopy(call[0].result())
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            call[0].set_exception(e)
+            raise
+        
+        with self._lock:
+            del self._calls[key]
+            waiters = call[1]
+        
+        # Waiters copy from a snapshot, as the leader's caller may modify its result
+        call[0].set_result(copy.deepcopy(result) if waiters else None)
+        return result
+
+
+class _AsyncSingleFlight:
+    """Event-loop counterpart of _SingleFlight."""
+    
+    def __init__(self):
+        self._calls = {}
+    
+    async def do(self, key, make_coro):
+        # Tasks belong to one event loop, so calls are shared per loop
+        call_key = (asyncio.get_running_loop(), key)
+        call = self._calls.get(call_key)
+        if call is not None:
+            call[1] += 1
+            _, snapshot = await asyncio.shield(call[0])
+            return copy.deepcopy(snapshot)
+        
+        async def run():
+            try:
+                result = await make_coro()
+            finally:
+                waiters = self._calls.pop(call_key)[1]
+            return result, copy.deepcopy(result) if waiters else None
+        
+        call = self._calls[call_key] = [asyncio.ensure_future(run()), 0]
+        # Shielded so that cancelling the first caller does not fail the waiters
+        result, _ = await asyncio.shield(call[0])
+        return result
+
+
+_in_flight = _SingleFlight()
+_in_flight_async = _AsyncSingleFlight()
+
+
+def _single_flight(kind, scholar_url, parser, fn, deadline_at=None):
+    profile = _profile_key(scholar_url)
+    if profile is None:
+        return fn()
+    return _in_flight.do((kind, profile, parser), fn, deadline_at)
+
+
+async def _single_flight_async(kind, scholar_url, parser, make_coro):
+    profile = _profile_key(scholar_url)
+    if profile is None:
+        return await make_coro()
+    return await _in_flight_async.do((kind, profile, parser), make_coro)
+
+
+async def _stored_async(key, coro):
+    return _store_result(key, await coro)
+
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def _retry_after_seconds(value):
+    """
+    Parse a Retry-After header, given either in seconds or as an HTTP date.
+    
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimiter:
+    """
+    Per-host token-bucket rate limiter with adaptive backoff.
+    
+    Each host gets a bucket refilled at its current rate. A throttling
+    response (429/503) halves that host's rate and pauses it for the
+    Retry-After period; every successful response recovers the rate by a
+    small step towards the configured one.
+    
+    Args:
+        rate (float): Requests per second allowed per host
+        burst (int): Bucket capacity, i.e. requests that may go out at once
+        min_rate (float): Lower bound for the rate after repeated backoff
+        backoff_factor (float): Rate multiplier applied on throttling
+        recovery (float): Fraction of ``rate`` regained per successful request
+    """
+    
+    def __init__(self, rate=2.0, burst=5, min_rate=0.05, backoff_factor=0.5, recovery=0.05):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.backoff_factor = backoff_factor
+        self.recovery = recovery
+        self.throttle_events = 0
+        self._hosts = {}
+        self._lock = threading.Lock()
+    
+    def _bucket(self, host, now):
+        bucket = self._hosts.get(host)
+        if bucket is None:
+            bucket = self._hosts[host] = {'tokens': float(self.burst), 'updated': now,
+                                          'rate': self.rate, 'paused_until': 0.0}
+        return bucket
+    
+    def reserve(self, host):
+        """
+        Take a token for one request to ``host``.
+        
+        Args:
+            host (str): Host the request goes to
+            
+        Returns:
+            float: Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            elapsed = now - bucket['updated']
+            bucket['tokens'] = min(self.burst, bucket['tokens'] + elapsed * bucket['rate'])
+            bucket['updated'] = now
+            # Tokens may go negative: later callers queue up behind earlier ones
+            bucket['tokens'] -= 1
+            delay = -bucket['tokens'] / bucket['rate'] if bucket['tokens'] < 0 else 0.0
+            return max(delay, bucket['paused_until'] - now)
+    
+    def acquire(self, host):
+        """Block until a request to ``host`` may be sent."""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+    
+    def throttled(self, host, retry_after=None):
+        """
+        Slow down after a throttling response from ``host``.
+        
+        Args:
+            host (str): Host that throttled the request
+            retry_after (float): Seconds from the Retry-After header, if any
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            bucket['rate'] = max(self.min_rate, bucket['rate'] * self.backoff_factor)
+            bucket['tokens'] = min(bucket['tokens'], 0.0)
+            pause = retry_after if retry_after is not None else 1.0 / bucket['rate']
+            bucket['paused_until'] = max(bucket['paused_until'], now + pause)
+            self.throttle_events += 1
+    
+    def try_acquire(self, host):
+        """
+        Take a token for ``host`` only if one is available right now.
+        
+        Returns:
+            bool: True if the request may be sent immediately
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            elapsed = now - bucket['updated']
+            bucket['tokens'] = min(self.burst, bucket['tokens'] + elapsed * bucket['rate'])
+            bucket['updated'] = now
+            if bucket['tokens'] < 1 or bucket['paused_until'] > now:
+                return False
+            bucket['tokens'] -= 1
+            return True
+    
+    def succeeded(self, host):
+        with self._lock:
+            bucket = self._bucket(host, time.monotonic())
+            bucket['rate'] = min(self.rate, bucket['rate'] + self.rate * self.recovery)
+    
+    def current_rate(self, host):
+        with self._lock:
+            bucket = self._hosts.get(host)
+            return bucket['rate'] if bucket is not None else self.rate
+    
+    def observe(self, host, status, retry_after_header=None):
+        """
+        Adapt the rate of ``host`` to a response status.
+        
+        Args:
+            host (str): Host that answered
+            status (int): HTTP status code
+            retry_after_header (str): Raw Retry-After header, if any
+        """
+        if status in THROTTLE_STATUSES:
+            self.throttled(host, _retry_after_seconds(retry_after_header))
+        elif status < 400:
+            self.succeeded(host)
+
+
+class RetryPolicy:
+    """
+    Retry policy for idempotent page fetches.
+    
+    Connection errors and the listed statuses are retried with exponential
+    backoff, so a flaky page costs extra requests for that page only.
+    
+    Args:
+        max_attempts (int): Attempts per request, including the first one
+        backoff (float): Delay in seconds before the first retry, doubled
+            for every further retry
+        max_backoff (float): Upper bound for a single delay
+        jitter (bool): Draw each delay uniformly from [0, delay] so that
+            concurrent workers do not retry in lockstep
+        retry_statuses (tuple): HTTP statuses that are retried
+    """
+    
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=30.0, jitter=True,
+                 retry_statuses=(429, 500, 502, 503, 504)):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+    
+    def delay(self, attempt, retry_after=None):
+        """
+        Seconds to wait before the next attempt.
+        
+        Args:
+            attempt (int): Number of the attempt that just failed, from 1
+            retry_after (float): Seconds from a Retry-After header, if any
+            
+        Returns:
+            float: Delay in seconds, never shorter than ``retry_after``
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class HedgePolicy:
+    """
+    Hedged requests: duplicate a request that is slower than usual.
+    
+    If a request has not completed within the current ``percentile`` of
+    recently observed latencies, one duplicate is sent and whichever
+    response arrives first is used. Duplicates are capped at ``budget``
+    times the number of requests, so hedging cannot amplify load.
+    
+    Args:
+        percentile (float): Latency percentile after which to hedge
+        budget (float): Maximum ratio of duplicate to original requests
+        min_samples (int): Latencies to observe before hedging starts
+        window (int): Number of recent latencies the percentile is taken over
+        max_workers (int): Threads used to run hedged requests; defaults to
+            the connection pool size, so hedging does not cap concurrency
+    """
+    
+    def __init__(self, percentile=0.95, budget=0.05, min_samples=20, window=500,
+                 max_workers=POOL_MAXSIZE):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def hedge_delay(self):
+        """
+        Seconds to wait for a response before hedging.
+        
+        Returns:
+            float: The latency percentile, or None while too few latencies
+                have been observed
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile))]
+    
+    def _timed(self, send, started=None):
+        if started is not None:
+            started.set()
+        start = time.monotonic()
+        response = send()
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+        return response
+    
+    def _claim_hedge(self):
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+    
+    def send(self, send, may_duplicate=None):
+        """
+        Run ``send``, hedging it with a second call if it is slow.
+        
+        Args:
+            send (callable): Sends the request and returns the response
+            may_duplicate (callable): Returns False to veto the duplicate,
+                e.g. when the rate limiter has no token to spare
+            
+        Returns:
+            The first successful response
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            self.requests += 1
+        if delay is None:
+            return self._timed(send)
+        
+        # The hedge delay runs from when the request starts, not from when
+        # it was queued behind other requests on the executor
+        started = threading.Event()
+        first = self._executor.submit(self._timed, send, started)
+        started.wait()
+        done, _ = wait([first], timeout=delay)
+        if done or not self._claim_hedge():
+            return first.result()
+        if may_duplicate is not None and not may_duplicate():
+            with self._lock:
+                self.hedges -= 1
+            return first.result()
+        
+        second = self._executor.submit(self._timed, send)
+        pending = {first, second}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The slower request still completes in the background
+                    # and its response is dropped
+                    if future is second:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                error = error or future.exception()
+        raise error
+    
+    def stats(self):
+        with self._lock:
+            return {'requests': self.requests, 'hedges': self.hedges,
+                    'hedge_wins': self.hedge_wins}
+
+
+# Fetch layer state, set by configure(). Pacing and retries are on by
+# default; everything else is off until configured.
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_result_cache = None
+_rate_limiter = RateLimiter()
+_retry_policy = RetryPolicy()
+_timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+_hedge_policy = None
+_checkpoint = None
+_metrics = None
+_tracer = None
+
+
+def _conditional_headers(entry):
+    headers = dict(HEADERS)
+    if entry is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def _parse_metrics(soup):
+    """
+    Extract the citation metrics from a parsed profile page.
+    
+    Args:
+        soup (BeautifulSoup): Parsed profile page
+        
+    Returns:
+        dict: Dictionary containing h-index and other citation metrics
+    """
+    metrics_table = soup.find('table', {'id': 'gsc_rsb_st'})
+    
+    if not metrics_table:
+        return {"error": "Could not find metrics table on the page"}
+    
+    metric_values = soup.find_all('td', class_='gsc_rsb_std')
+    
+    results = {}
+    
+    if len(metric_values) >= 6:
+        results['citations_all'] = metric_values[0].get_text(strip=True)
+        results['citations_recent'] = metric_values[1].get_text(strip=True)
+        results['h_index_all'] = metric_values[2].get_text(strip=True)
+        results['h_index_recent'] = metric_values[3].get_text(strip=True)
+        results['i10_index_all'] = metric_values[4].get_text(strip=True)
+        results['i10_index_recent'] = metric_values[5].get_text(strip=True)
+    else:
+        return {"error": f"Expected 6 metric values, found {len(metric_values)}"}
+    
+    name_elem = soup.find('div', {'id': 'gsc_prf_in'})
+    if name_elem:
+        results['name'] = name_elem.get_text(strip=True)
+    
+    return results
+
+
+def _parse_has_more(soup):
+    """
+    Tell from the "show more" button whether more publications follow.
+    
+    Args:
+        soup (BeautifulSoup): Parsed profile page
+        
+    Returns:
+        bool: False if the button is disabled, True if it is enabled, or None
+            if the page has no such button
+    """
+    more_button = soup.find('button', {'id': 'gsc_bpf_more'})
+    if more_button is None:
+        return None
+    return not more_button.has_attr('disabled')
+
+
+def _extract_publication(nodes, text_of):
+    """
+    Build a publication dict in a single walk over a publication row.
+    
+    Shared by all parser backends, which only differ in how they list a
+    row's elements and read their text.
+    
+    Args:
+        nodes (iterable): (tag name, classes, href, element) for every
+            descendant element of the row, in document order
+        text_of (callable): Returns the stripped text of an element
+        
+    Returns:
+        dict: Publication details
+    """
+    title = pub_id = authors = venue = year_text = citations_text = None
+    
+    for name, classes, href, elem in nodes:
+        if name == 'a':
+            if title is None and 'gsc_a_at' in classes:
+                title = text_of(elem)
+                # The title link points at the publication's own page
+                id_match = re.search(r'citation_for_view=([^&]+)', href or '')
+                pub_id = id_match.group(1) if id_match else None
+            elif citations_text is None and 'gsc_a_ac' in classes:
+                citations_text = text_of(elem)
+        elif name == 'div' and 'gs_gray' in classes:
+            # First gs_gray div holds the authors, the second one the venue
+            if authors is None:
+                authors = text_of(elem)
+            elif venue is None:
+                venue = text_of(elem)
+        elif name == 'span' and year_text is None and 'gsc_a_h' in classes:
+            year_text = text_of(elem)
+    
+    pub = {
+        'title': title if title is not None else 'N/A',
+        'authors': authors if authors is not None else 'N/A',
+        'venue': venue if venue is not None else 'N/A',
+        'year': year_text if year_text else 'N/A',
+    }
+    
+    try:
+        pub['citations'] = int(citations_text) if citations_text else 0
+    except ValueError:
+        pub['citations'] = 0
+    
+    pub['pub_id'] = pub_id if pub_id else 'N/A'
+    
+    return pub
+
+
+def _soup_row_nodes(row):
+    for node in row.descendants:
+        if isinstance(node, Tag):
+            yield node.name, node.get('class') or (), node.get('href'), node
+
+
+def _soup_text(tag):
+    return tag.get_text(strip=True)
+
+
+def _parse_publication_rows(soup):
+    """
+    Extract the publications listed on one parsed profile page.
+    
+    Args:
+        soup (BeautifulSoup): Parsed profile page
+        
+    Returns:
+        list: List of dictionaries containing publication details
+    """
+    return [_extract_publication(_soup_row_nodes(row), _soup_text)
+            for row in soup.find_all('tr', class_='gsc_a_tr')]
+
+
+def _xpath_class(cls):
+    return f'contains(concat(" ", normalize-space(@class), " "), " {cls} ")'
+
+
+def _xpath_text(elem):
+    # Same result as BeautifulSoup's get_text(strip=True)
+    return ''.join(text.strip() for text in elem.xpath('.//text()'))
+
+
+def _parse_metrics_xpath(root):
+    """
+    Extract the citation metrics from an lxml profile page tree.
+    
+    Mirrors _parse_metrics, including its error results.
+    
+    Args:
+        root (lxml.html.HtmlElement): Parsed profile page
+        
+    Returns:
+        dict: Dictionary containing h-index and other citation metrics
+    """
+    if not root.xpath('//table[@id="gsc_rsb_st"]'):
+        return {"error": "Could not find metrics table on the page"}
+    
+    metric_values = root.xpath(f'//td[{_xpath_class("gsc_rsb_std")}]')
+    
+    if len(metric_values) < 6:
+        return {"error": f"Expected 6 metric values, found {len(metric_values)}"}
+    
+    keys = ('citations_all', 'citations_recent', 'h_index_all', 'h_index_recent',
+            'i10_index_all', 'i10_index_recent')
+    results = {key: _xpath_text(value) for key, value in zip(keys, metric_values)}
+    
+    name_elems = root.xpath('//div[@id="gsc_prf_in"]')
+    if name_elems:
+        results['name'] = _xpath_text(name_elems[0])
+    
+    return results
+
+
+def _lxml_row_nodes(row):
+    for elem in row.iterdescendants():
+        # Skip comments and processing instructions
+        if isinstance(elem.tag, str):
+            yield elem.tag, (elem.get('class') or '').split(), elem.get('href'), elem
+
+
+def _parse_publication_rows_xpath(root):
+    """
+    Extract the publications listed on one lxml profile page tree.
+    
+    Mirrors _parse_publication_rows.
+    
+    Args:
+        root (lxml.html.HtmlElement): Parsed profile page
+        
+    Returns:
+        list: List of dictionaries containing publication details
+    """
+    return [_extract_publication(_lxml_row_nodes(row), _xpath_text)
+            for row in root.xpath(f'//tr[{_xpath_class("gsc_a_tr")}]')]
+
+
+def _parse_has_more_xpath(root):
+    more_buttons = root.xpath('//button[@id="gsc_bpf_more"]')
+    if not more_buttons:
+        return None
+    return more_buttons[0].get('disabled') is None
+
+
+def _parse_page(content, parser, metrics=False, publications=False):
+    """
+    Parse a profile page with the given backend.
+    
+    Args:
+        content (bytes): Raw HTML of the page
+        parser (str): One of PARSERS
+        metrics (bool): Extract the citation metrics
+        publications (bool): Extract the publication rows
+        
+    Returns:
+        tuple: (metrics dict, publications list, has_more), with None for
+            each part that was not requested. Successful metrics record the
+            backend under 'parser'; has_more is the "show more" button state
+            (see _parse_has_more).
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown parser {parser!r}, expected one of {PARSERS}")
+    
+    started = time.perf_counter()
+    
+    with _span('parse', parser=parser, bytes=len(content)):
+        if parser == 'lxml-xpath':
+            if lxml_html is None:
+                raise ImportError("The 'lxml-xpath' parser requires lxml")
+            root = lxml_html.fromstring(content)
+            parse_metrics, parse_rows, parse_has_more = (
+                _parse_metrics_xpath, _parse_publication_rows_xpath, _parse_has_more_xpath)
+        else:
+            strainer = None
+            if parser in _STRAINER_PARSERS:
+                if metrics and publications:
+                    strainer = _PROFILE_STRAINER
+                elif metrics:
+                    strainer = _METRICS_STRAINER
+                elif publications:
+                    strainer = _PUBLICATIONS_STRAINER
+            root = BeautifulSoup(content, parser, parse_only=strainer)
+            parse_metrics, parse_rows, parse_has_more = (
+                _parse_metrics, _parse_publication_rows, _parse_has_more)
+    
+    with _span('extract', parser=parser) as span:
+        results = parse_metrics(root) if metrics else None
+        if results is not None and "error" not in results:
+            results['parser'] = parser
+        
+        rows = has_more = None
+        if publications:
+            rows, has_more = parse_rows(root), parse_has_more(root)
+            span.set_attribute('rows', len(rows))
+            _observe('rows_per_page', len(rows), parser=parser)
+    
+    _observe('parse_seconds', time.perf_counter() - started, parser=parser)
+    
+    return results, rows, has_more
+
+
+def _is_last_page(page, has_more, page_size):
+    # A disabled "show more" button ends the list even when the page is
+    # full, which saves requesting a trailing empty page
+    return has_more is False or len(page) < page_size
+
+
+class _Abandoned(Exception):
+    """Raised in a speculative fetch whose page is no longer wanted."""
+
+
+def _sleep(delay, deadline_at, stop=None):
+    _check_deadline(deadline_at, delay)
+    if delay > 0:
+        if stop is not None:
+            # Wake up early when the crawl abandons this fetch
+            stop.wait(delay)
+        else:
+            time.sleep(delay)
+
+
+def _request_timeout(deadline_at):
+    # Never wait on a socket past the deadline
+    remaining = _check_deadline(deadline_at)
+    if remaining is None:
+        return _timeout
+    if _timeout is None:
+        return (remaining, remaining)
+    return tuple(min(limit, remaining) for limit in _timeout)
+
+
+def _send(url, headers, timeout, host, hedge):
+    session = get_session()
+    
+    def send():
+        # Recorded here so that hedged duplicates are measured too
+        started = time.perf_counter()
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            _record_request('error', time.perf_counter() - started)
+            raise
+        _record_request(response.status_code, time.perf_counter() - started,
+                        len(response.content))
+        return response
+    
+    policy = _hedge_policy
+    if not hedge or policy is None:
+        return send()
+    
+    # A duplicate must not jump the rate limiter's queue
+    limiter = _rate_limiter
+    
+    def may_duplicate():
+        if limiter is not None and not limiter.try_acquire(host):
+            return False
+        _increment('hedges')
+        return True
+    
+    return policy.send(send, may_duplicate=may_duplicate)
+
+
+def _record_request(status, seconds, size=0):
+    _increment('requests', status=str(status))
+    _observe('request_seconds', seconds, status=str(status))
+    if size:
+        _increment('bytes_downloaded', size)
+    if status in THROTTLE_STATUSES:
+        _increment('throttle_events', status=str(status))
+
+
+def _request(url, headers, deadline_at=None, hedge=False, stop=None):
+    limiter = _rate_limiter
+    policy = _retry_policy
+    max_attempts = policy.max_attempts if policy is not None else 1
+    host = urlparse(url).netloc
+    
+    attempt = 0
+    while True:
+        attempt += 1
+        if limiter is not None:
+            _sleep(limiter.reserve(host), deadline_at, stop)
+        
+        # A speculative page the crawl no longer needs is never sent
+        if stop is not None and stop.is_set():
+            raise _Abandoned(url)
+        
+        try:
+            with _span('request', attempt=attempt) as span:
+                response = _send(url, headers, _request_timeout(deadline_at), host, hedge)
+                span.set_attribute('status', response.status_code)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt >= max_attempts:
+                _check_deadline(deadline_at)
+                raise
+            _increment('retries', reason='error')
+            _sleep(policy.delay(attempt), deadline_at, stop)
+            continue
+        
+        retry_after = response.headers.get('Retry-After')
+        if limiter is not None:
+            limiter.observe(host, response.status_code, retry_after)
+        
+        if attempt >= max_attempts or response.status_code not in policy.retry_statuses:
+            return response
+        
+        _increment('retries', reason=str(response.status_code))
+        _sleep(policy.delay(attempt, _retry_after_seconds(retry_after)), deadline_at, stop)
+
+
+def _fetch(url, deadline_at=None, hedge=False, stop=None):
+    with _span('fetch', url=url):
+        return _fetch_page(url, deadline_at, hedge, stop)
+
+
+def _fetch_page(url, deadline_at, hedge, stop):
+    cache = _cache
+    entry = cache.get(url) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry):
+        _increment('cache_hits', cache='http')
+        _increment('pages_fetched', source='cache')
+        return entry['content']
+    
+    if cache is not None:
+        _increment('cache_misses', cache='http')
+    
+    response = _request(url, _conditional_headers(entry), deadline_at, hedge, stop)
+    
+    if entry is not None and response.status_code == 304:
+        _increment('cache_revalidations')
+        _increment('pages_fetched', source='revalidated')
+        cache.touch(url, entry)
+        return entry['content']
+    
+    response.raise_for_status()
+    
+    if cache is not None:
+        cache.put(url, response.content, response.headers.get('ETag'),
+                  response.headers.get('Last-Modified'))
+    
+    _increment('pages_fetched', source='network')
+    return response.content
+
+
+def _get_h_index(scholar_url, parser):
+    try:
+        profile = _profile_key(scholar_url)
+        if profile is None:
+            return {"error": "Could not extract user ID from URL"}
+        
+        metrics, _, _ = _parse_page(_fetch(profile.profile_url()), parser, metrics=True)
+        
+        return metrics
+        
+    except requests.exceptions.RequestException as e:
+        return {"error": f"Request failed: {str(e)}"}
+    except Exception as e:
+        return {"error": f"An error occurred: {str(e)}"}
+
+
+@_instrumented('get_h_index')
+def get_h_index(scholar_url, parser=DEFAULT_PARSER):
     """
     Scrape Google Scholar profile page and extract h-index.
     
     Args:
         scholar_url (str): URL of the Google Scholar profile page
+        parser (str): HTML parser backend, one of PARSERS
         
     Returns:
         dict: Dictionary containing h-index and other citation metrics
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+    key, cached = _lookup_result('metrics', scholar_url, parser)
+    if cached is not None:
+        return cached
+    
+    return _single_flight('metrics', scholar_url, parser,
+                          lambda: _store_result(key, _get_h_index(scholar_url, parser)))
+
+
+def _fetch_publication_page(profile, start, parser, page_size, metrics, deadline_at, stop=None):
+    with _span('page', start=start):
+        content = _fetch(profile.page_url(start, page_size), deadline_at, hedge=True, stop=stop)
         
-        response = requests.get(scholar_url, headers=headers)
-        response.raise_for_status()
+        return _parse_page(content, parser, metrics=metrics and start == 0, publications=True)
+
+
+def _fetch_publication_pages(profile, start, parser, page_size, prefetch, metrics, deadline_at):
+    # Yields (start, metrics, page, is_last) from offset ``start`` on
+    while True:
+        metrics_result, page, has_more = _fetch_publication_page(profile, start, parser,
+                                                                 page_size, metrics, deadline_at)
+        # Check if there are more publications
+        last = _is_last_page(page, has_more, page_size)
+        yield start, metrics_result, page, last
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if last:
+            return
         
-        metrics_table = soup.find('table', {'id': 'gsc_rsb_st'})
+        start += page_size
+        
+        # Speculate only once a page says more follow, so profiles that fit
+        # on the first page cost a single request
+        if prefetch > 0 and has_more is True:
+            break
+    
+    yield from _prefetch_publication_pages(profile, start, parser, page_size, prefetch, metrics,
+                                           deadline_at)
+
+
+def _prefetch_publication_pages(profile, start, parser, page_size, prefetch, metrics,
+                                deadline_at):
+    # Keep up to prefetch + 1 consecutive offsets in flight and hand out the
+    # pages in order until the last page is reached
+    executor = ThreadPoolExecutor(max_workers=prefetch + 1)
+    stop = threading.Event()
+    in_flight = deque()
+    next_start = start
+    try:
+        while True:
+            while len(in_flight) <= prefetch:
+                in_flight.append((next_start, _submit(
+                    executor, _fetch_publication_page, profile, next_start, parser, page_size,
+                    metrics, deadline_at, stop)))
+                next_start += page_size
+            
+            start, future = in_flight.popleft()
+            metrics_result, page, has_more = future.result()
+            last = _is_last_page(page, has_more, page_size)
+            yield start, metrics_result, page, last
+            
+            if last:
+                return
+    finally:
+        # Speculative fetches past the end are abandoned: queued ones are
+        # cancelled, and those waiting on the rate limiter or a retry wake
+        # up and return without sending. Only requests already on the wire
+        # finish, on the pool's threads, and their pages are discarded.
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_publication_pages(profile, parser, page_size=PAGE_SIZE, prefetch=0, metrics=False,
+                            deadline_at=None):
+    """
+    Fetch and parse the publication pages of a profile in order.
+    
+    With a checkpoint store configured, pages saved by an earlier,
+    interrupted crawl are replayed first and fetching resumes after them.
+    
+    Args:
+        profile (ProfileKey): Profile to page through
+        parser (str): HTML parser backend, one of PARSERS
+        page_size (int): Publications requested per page
+        prefetch (int): Number of following page offsets fetched
+            speculatively while the current page is outstanding
+        metrics (bool): Also extract the metrics from the first page
+        deadline_at (float): time.monotonic() value by which the crawl must
+            end, or None
         
-        if not metrics_table:
-            return {"error": "Could not find metrics table on the page"}
+    Yields:
+        tuple: (metrics dict or None, publications list) per page
         
-        metric_values = soup.find_all('td', class_='gsc_rsb_std')
+    Raises:
+        DeadlineExceeded: If the deadline passes before the last page
+    """
+    checkpoint = _checkpoint
+    start = 0
+    
+    if checkpoint is not None:
+        for saved_start, saved_metrics, page in checkpoint.load(profile, page_size):
+            yield (saved_metrics if metrics else None), page
+            start = saved_start + page_size
+    
+    # The first page's metrics are checkpointed for a later scrape_profile
+    parse_metrics = metrics or checkpoint is not None
+    pages = _fetch_publication_pages(profile, start, parser, page_size, prefetch, parse_metrics,
+                                     deadline_at)
+    for page_start, metrics_result, page, last in pages:
+        if checkpoint is not None:
+            if last:
+                checkpoint.clear(profile)
+            else:
+                checkpoint.save(profile, page_size, page_start, metrics_result, page)
+        yield (metrics_result if metrics else None), page
+
+
+def iter_publications(scholar_url, parser=DEFAULT_PARSER, prefetch=0, deadline=None):
+    """
+    Yield the publications of a profile as soon as each page is parsed.
+    
+    Unlike get_publications, errors are raised rather than returned, after
+    all publications of the pages fetched so far have been yielded.
+    
+    Args:
+        scholar_url (str): URL of the Google Scholar profile page
+        parser (str): HTML parser backend, one of PARSERS
+        prefetch (int): Number of following pages fetched concurrently ahead
+            of the one being parsed; 0 fetches pages one after another
+        deadline (float): Seconds the whole crawl may take, or None
         
-        results = {}
+    Yields:
+        dict: Publication details
         
-        if len(metric_values) >= 6:
-            results['citations_all'] = metric_values[0].get_text(strip=True)
-            results['citations_recent'] = metric_values[1].get_text(strip=True)
-            results['h_index_all'] = metric_values[2].get_text(strip=True)
-            results['h_index_recent'] = metric_values[3].get_text(strip=True)
-            results['i10_index_all'] = metric_values[4].get_text(strip=True)
-            results['i10_index_recent'] = metric_values[5].get_text(strip=True)
-        else:
-            return {"error": f"Expected 6 metric values, found {len(metric_values)}"}
+    Raises:
+        ValueError: If the URL has no user ID
+        requests.exceptions.RequestException: If fetching a page fails
+        DeadlineExceeded: If the deadline runs out before the last page
+    """
+    profile = ProfileKey.from_url(scholar_url)
+    
+    pages = _iter_publication_pages(profile, parser, prefetch=prefetch,
+                                    deadline_at=_deadline_at(deadline))
+    for _, page in pages:
+        yield from page
+
+
+def _get_publications(scholar_url, parser, prefetch, deadline_at):
+    try:
+        profile = _profile_key(scholar_url)
+        if profile is None:
+            return {"error": "Could not extract user ID from URL"}
         
-        name_elem = soup.find('div', {'id': 'gsc_prf_in'})
-        if name_elem:
-            results['name'] = name_elem.get_text(strip=True)
+        publications = PublicationList()
+        publications.parser = parser
+        try:
+            for _, page in _iter_publication_pages(profile, parser, prefetch=prefetch,
+                                                   deadline_at=deadline_at):
+                publications.extend(page)
+        except DeadlineExceeded:
+            publications.partial = True
         
-        return results
+        return publications
         
     except requests.exceptions.RequestException as e:
         return {"error": f"Request failed: {str(e)}"}
@@ -53,110 +2039,511 @@ def get_h_index(scholar_url):
         return {"error": f"An error occurred: {str(e)}"}
 
 
-def get_publications(scholar_url):
+@_instrumented('get_publications')
+def get_publications(scholar_url, parser=DEFAULT_PARSER, prefetch=0, deadline=None):
     """
     Scrape all publications from a Google Scholar profile page.
     
     Args:
         scholar_url (str): URL of the Google Scholar profile page
+        parser (str): HTML parser backend, one of PARSERS
+        prefetch (int): Number of following pages fetched concurrently ahead
+            of the one being parsed; 0 fetches pages one after another
+        deadline (float): Seconds the whole crawl may take, or None. When it
+            runs out, the publications parsed so far are returned with
+            ``partial`` set.
         
     Returns:
-        list: List of dictionaries containing publication details
+        PublicationList: List of dictionaries containing publication details,
+            with the ``parser`` that produced them
     """
+    deadline_at = _deadline_at(deadline)
+    key, cached = _lookup_result('publications', scholar_url, parser)
+    if cached is not None:
+        return cached
+    
+    return _single_flight('publications', scholar_url, parser,
+                          lambda: _store_result(key, _get_publications(scholar_url, parser, prefetch,
+                                                                       deadline_at)),
+                          deadline_at)
+
+
+def _scrape_profile(scholar_url, parser, prefetch, deadline_at):
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # Extract user ID from URL to construct the "show more" URL
-        user_match = re.search(r'user=([^&]+)', scholar_url)
-        if not user_match:
+        profile = _profile_key(scholar_url)
+        if profile is None:
             return {"error": "Could not extract user ID from URL"}
         
-        user_id = user_match.group(1)
+        metrics = None
+        publications = PublicationList()
+        publications.parser = parser
         
-        # Get language parameter if present
-        lang_match = re.search(r'hl=([^&]+)', scholar_url)
-        lang = lang_match.group(1) if lang_match else 'en'
+        pages = _iter_publication_pages(profile, parser, prefetch=prefetch, metrics=True,
+                                        deadline_at=deadline_at)
+        try:
+            for page_metrics, page in pages:
+                if page_metrics is not None:
+                    metrics = page_metrics
+                publications.extend(page)
+        except DeadlineExceeded:
+            publications.partial = True
         
-        publications = []
-        start = 0
-        page_size = 100
+        return {'metrics': metrics, 'publications': publications, 'parser': parser,
+                'partial': publications.partial}
         
-        while True:
-            # Construct URL with pagination
-            url = f"https://scholar.google.de/citations?user={user_id}&hl={lang}&cstart={start}&pagesize={page_size}"
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all publication rows
-            pub_rows = soup.find_all('tr', class_='gsc_a_tr')
+    except requests.exceptions.RequestException as e:
+        return {"error": f"Request failed: {str(e)}"}
+    except Exception as e:
+        return {"error": f"An error occurred: {str(e)}"}
+
+
+@_instrumented('scrape_profile', counter='profiles_scraped')
+def scrape_profile(scholar_url, parser=DEFAULT_PARSER, prefetch=0, deadline=None):
+    """
+    Scrape metrics and all publications of a profile, fetching every page once.
+    
+    The first publication page is the profile page itself, so the metrics
+    table is read from the same response instead of a separate request.
+    
+    Args:
+        scholar_url (str): URL of the Google Scholar profile page
+        parser (str): HTML parser backend, one of PARSERS
+        prefetch (int): Number of following pages fetched concurrently ahead
+            of the one being parsed; 0 fetches pages one after another
+        deadline (float): Seconds the whole crawl may take, or None
+        
+    Returns:
+        dict: Dictionary with 'metrics' (as returned by get_h_index),
+            'publications' (as returned by get_publications), the 'parser'
+            backend that produced them and whether the result is 'partial'
+            because the deadline ran out (metrics are None if that happened
+            before the first page)
+    """
+    deadline_at = _deadline_at(deadline)
+    key, cached = _lookup_result('profile', scholar_url, parser)
+    if cached is not None:
+        return cached
+    
+    return _single_flight('profile', scholar_url, parser,
+                          lambda: _store_result(key, _scrape_profile(scholar_url, parser, prefetch,
+                                                                     deadline_at)),
+                          deadline_at)
+
+
+def scrape_profiles(urls, max_workers=8, per_host_limit=None, ordered=True, parser=DEFAULT_PARSER,
+                    prefetch=0, deadline=None):
+    """
+    Scrape many profiles concurrently with a bounded worker pool.
+    
+    A failing profile yields its error dict and does not stop the batch.
+    At most twice as many profiles as worker threads are in flight at a
+    time, so ``urls`` may be a lazy iterable over a very large input. URLs that spell a profile
+    already in flight (see ProfileKey) share its crawl instead of starting
+    another; configure a ResultCache to also collapse later repeats.
+    
+    Args:
+        urls (iterable): URLs of Google Scholar profile pages
+        max_workers (int): Number of worker threads
+        per_host_limit (int): Maximum number of profiles scraped concurrently
+            against the citations endpoint, or None for no limit. Every page
+            is fetched from that one host, so this caps the number of worker
+            threads.
+        ordered (bool): Yield results in input order instead of as they complete
+        parser (str): HTML parser backend, one of PARSERS
+        prefetch (int): Pages fetched ahead within each profile, see
+            scrape_profile
+        deadline (float): Seconds each profile's crawl may take, see
+            scrape_profile
+        
+    Yields:
+        tuple: (url, result) for every input URL, with result as returned by
+            scrape_profile
+    """
+    # All profiles share the citations host, so the per-host limit bounds
+    # the pool itself rather than idling threads on a semaphore
+    if per_host_limit is not None:
+        max_workers = min(max_workers, per_host_limit)
+    max_workers = max(1, max_workers)
+    
+    def scrape_one(url):
+        _adjust('queue_depth', -1)
+        try:
+            return scrape_profile(url, parser, prefetch, deadline)
+        except Exception as e:
+            return {"error": f"An error occurred: {str(e)}"}
+    
+    max_pending = max_workers * 2
+    # Future -> (profile key, input URLs still waiting for its result)
+    pending = {}
+    by_key = {}
+    order = deque()
+    
+    def finished():
+        if ordered:
+            url, future = order.popleft()
+            key, waiting = pending[future]
+            waiting.remove(url)
+            if waiting:
+                # Duplicates still to come get their own copy
+                yield url, copy.deepcopy(future.result())
+            else:
+                del pending[future]
+                by_key.pop(key, None)
+                yield url, future.result()
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, waiting = pending.pop(future)
+                by_key.pop(key, None)
+                for i, url in enumerate(waiting):
+                    yield url, future.result() if i == 0 else copy.deepcopy(future.result())
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for url in urls:
+                key = _profile_key(url)
+                future = by_key.get(key) if key is not None else None
+                if future is None:
+                    _adjust('queue_depth', 1)
+                    future = _submit(executor, scrape_one, url)
+                    # Profiles cancelled before they start leave the queue here
+                    future.add_done_callback(
+                        lambda f: f.cancelled() and _adjust('queue_depth', -1))
+                    pending[future] = (key, [])
+                    if key is not None:
+                        by_key[key] = future
+                pending[future][1].append(url)
+                if ordered:
+                    order.append((url, future))
+                if len(pending) >= max_pending:
+                    yield from finished()
             
-            if not pub_rows:
-                break
+            while pending:
+                yield from finished()
+        finally:
+            # Don't start queued profiles if the caller stops iterating early
+            for future in pending:
+                future.cancel()
+
+
+def _require_aiohttp():
+    if aiohttp is None:
+        raise ImportError("The async scraping API requires aiohttp")
+
+
+class _AsyncSession:
+    """Use the given aiohttp session, or open (and close) a private one."""
+    
+    def __init__(self, session):
+        self.session = session
+        self.owned = session is None
+    
+    async def __aenter__(self):
+        if self.owned:
+            connector = aiohttp.TCPConnector(limit=POOL_MAXSIZE)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+    
+    async def __aexit__(self, *exc_info):
+        if self.owned:
+            await self.session.close()
+
+
+def _async_timeout():
+    if _timeout is None:
+        return aiohttp.ClientTimeout(total=None)
+    connect, read = _timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+async def _request_async(session, url, headers):
+    limiter = _rate_limiter
+    policy = _retry_policy
+    max_attempts = policy.max_attempts if policy is not None else 1
+    host = urlparse(url).netloc
+    
+    attempt = 0
+    while True:
+        attempt += 1
+        if limiter is not None:
+            delay = limiter.reserve(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        
+        started = time.perf_counter()
+        try:
+            with _span('request', attempt=attempt) as span:
+                async with session.get(url, headers=headers, timeout=_async_timeout()) as response:
+                    content = await response.read()
+                span.set_attribute('status', response.status)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            _record_request('error', time.perf_counter() - started)
+            if attempt >= max_attempts:
+                raise
+            _increment('retries', reason='error')
+            await asyncio.sleep(policy.delay(attempt))
+            continue
+        
+        _record_request(response.status, time.perf_counter() - started, len(content))
+        
+        retry_after = response.headers.get('Retry-After')
+        if limiter is not None:
+            limiter.observe(host, response.status, retry_after)
+        
+        if attempt >= max_attempts or response.status not in policy.retry_statuses:
+            return response, content
+        
+        _increment('retries', reason=str(response.status))
+        await asyncio.sleep(policy.delay(attempt, _retry_after_seconds(retry_after)))
+
+
+async def _fetch_async(session, url):
+    with _span('fetch', url=url):
+        return await _fetch_page_async(session, url)
+
+
+async def _fetch_page_async(session, url):
+    # Disk cache reads and writes run on worker threads, off the event loop
+    cache = _cache
+    entry = await asyncio.to_thread(cache.get, url) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry):
+        _increment('cache_hits', cache='http')
+        _increment('pages_fetched', source='cache')
+        return entry['content']
+    
+    if cache is not None:
+        _increment('cache_misses', cache='http')
+    
+    response, content = await _request_async(session, url, _conditional_headers(entry))
+    
+    if entry is not None and response.status == 304:
+        _increment('cache_revalidations')
+        _increment('pages_fetched', source='revalidated')
+        await asyncio.to_thread(cache.touch, url, entry)
+        return entry['content']
+    
+    response.raise_for_status()
+    
+    if cache is not None:
+        await asyncio.to_thread(cache.put, url, content, response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'))
+    
+    _increment('pages_fetched', source='network')
+    return content
+
+
+async def _parse_page_async(content, parser, metrics=False, publications=False):
+    # Parsing is CPU-bound (tens of ms per page), so it runs on a worker thread
+    return await asyncio.to_thread(_parse_page, content, parser, metrics, publications)
+
+
+async def _collect_remaining_publications_async(session, profile, publications, start, parser,
+                                                page_size=PAGE_SIZE):
+    while True:
+        with _span('page', start=start):
+            content = await _fetch_async(session, profile.page_url(start, page_size))
             
-            for row in pub_rows:
-                pub = {}
-                
-                # Extract title
-                title_elem = row.find('a', class_='gsc_a_at')
-                if title_elem:
-                    pub['title'] = title_elem.get_text(strip=True)
-                else:
-                    pub['title'] = 'N/A'
-                
-                # Extract authors and venue
-                authors_elem = row.find('div', class_='gs_gray')
-                if authors_elem:
-                    pub['authors'] = authors_elem.get_text(strip=True)
-                else:
-                    pub['authors'] = 'N/A'
-                
-                # Extract venue (second gs_gray div)
-                venue_elems = row.find_all('div', class_='gs_gray')
-                if len(venue_elems) > 1:
-                    pub['venue'] = venue_elems[1].get_text(strip=True)
-                else:
-                    pub['venue'] = 'N/A'
-                
-                # Extract year
-                year_elem = row.find('span', class_='gsc_a_h')
-                if year_elem:
-                    year_text = year_elem.get_text(strip=True)
-                    pub['year'] = year_text if year_text else 'N/A'
-                else:
-                    pub['year'] = 'N/A'
-                
-                # Extract citations
-                citations_elem = row.find('a', class_='gsc_a_ac')
-                if citations_elem:
-                    citations_text = citations_elem.get_text(strip=True)
-                    try:
-                        pub['citations'] = int(citations_text) if citations_text else 0
-                    except ValueError:
-                        pub['citations'] = 0
-                else:
-                    pub['citations'] = 0
+            _, page, has_more = await _parse_page_async(content, parser, publications=True)
+        publications.extend(page)
+        
+        if _is_last_page(page, has_more, page_size):
+            return publications
+        
+        start += page_size
+
+
+async def _async_get_h_index(scholar_url, session, parser):
+    _require_aiohttp()
+    
+    try:
+        profile = _profile_key(scholar_url)
+        if profile is None:
+            return {"error": "Could not extract user ID from URL"}
+        
+        async with _AsyncSession(session) as session:
+            content = await _fetch_async(session, profile.profile_url())
+        
+        metrics, _, _ = await _parse_page_async(content, parser, metrics=True)
+        
+        return metrics
+        
+    except aiohttp.ClientError as e:
+        return {"error": f"Request failed: {str(e)}"}
+    except Exception as e:
+        return {"error": f"An error occurred: {str(e)}"}
+
+
+@_instrumented('async_get_h_index')
+async def async_get_h_index(scholar_url, session=None, parser=DEFAULT_PARSER):
+    """
+    Async counterpart of get_h_index.
+    
+    Args:
+        scholar_url (str): URL of the Google Scholar profile page
+        session (aiohttp.ClientSession): Session to reuse; a private one is
+            opened for this call if omitted
+        parser (str): HTML parser backend, one of PARSERS
+        
+    Returns:
+        dict: Dictionary containing h-index and other citation metrics
+    """
+    key, cached = _lookup_result('metrics', scholar_url, parser)
+    if cached is not None:
+        return cached
+    
+    return await _single_flight_async('metrics', scholar_url, parser,
+                                      lambda: _stored_async(key, _async_get_h_index(scholar_url, session, parser)))
+
+
+async def _async_get_publications(scholar_url, session, parser):
+    _require_aiohttp()
+    
+    try:
+        profile = _profile_key(scholar_url)
+        if profile is None:
+            return {"error": "Could not extract user ID from URL"}
+        
+        async with _AsyncSession(session) as session:
+            return await _collect_remaining_publications_async(session, profile, [], 0, parser)
+        
+    except aiohttp.ClientError as e:
+        return {"error": f"Request failed: {str(e)}"}
+    except Exception as e:
+        return {"error": f"An error occurred: {str(e)}"}
+
+
+@_instrumented('async_get_publications')
+async def async_get_publications(scholar_url, session=None, parser=DEFAULT_PARSER):
+    """
+    Async counterpart of get_publications.
+    
+    Args:
+        scholar_url (str): URL of the Google Scholar profile page
+        session (aiohttp.ClientSession): Session to reuse; a private one is
+            opened for this call if omitted
+        parser (str): HTML parser backend, one of PARSERS
+        
+    Returns:
+        list: List of dictionaries containing publication details
+    """
+    key, cached = _lookup_result('publications', scholar_url, parser)
+    if cached is not None:
+        return cached
+    
+    return await _single_flight_async('publications', scholar_url, parser,
+                                      lambda: _stored_async(key, _async_get_publications(scholar_url, session, parser)))
+
+
+async def _async_scrape_profile(scholar_url, session, parser):
+    _require_aiohttp()
+    
+    try:
+        profile = _profile_key(scholar_url)
+        if profile is None:
+            return {"error": "Could not extract user ID from URL"}
+        
+        async with _AsyncSession(session) as session:
+            with _span('page', start=0):
+                content = await _fetch_async(session, profile.page_url(0))
                 
-                publications.append(pub)
-            
-            # Check if there are more publications
-            if len(pub_rows) < page_size:
-                break
+                metrics, publications, has_more = await _parse_page_async(
+                    content, parser, metrics=True, publications=True)
             
-            start += page_size
+            if not _is_last_page(publications, has_more, PAGE_SIZE):
+                await _collect_remaining_publications_async(session, profile, publications,
+                                                            PAGE_SIZE, parser)
         
-        return publications
+        return {'metrics': metrics, 'publications': publications, 'parser': parser}
         
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         return {"error": f"Request failed: {str(e)}"}
     except Exception as e:
         return {"error": f"An error occurred: {str(e)}"}
 
 
+@_instrumented('async_scrape_profile', counter='profiles_scraped')
+async def async_scrape_profile(scholar_url, session=None, parser=DEFAULT_PARSER):
+    """
+    Async counterpart of scrape_profile.
+    
+    Args:
+        scholar_url (str): URL of the Google Scholar profile page
+        session (aiohttp.ClientSession): Session to reuse; a private one is
+            opened for this call if omitted
+        parser (str): HTML parser backend, one of PARSERS
+        
+    Returns:
+        dict: Dictionary with 'metrics', 'publications' and 'parser'
+    """
+    key, cached = _lookup_result('profile', scholar_url, parser)
+    if cached is not None:
+        return cached
+    
+    return await _single_flight_async('profile', scholar_url, parser,
+                                      lambda: _stored_async(key, _async_scrape_profile(scholar_url, session, parser)))
+
+
+async def async_scrape_profiles(urls, concurrency=50, session=None, parser=DEFAULT_PARSER):
+    """
+    Scrape many profiles on the event loop, at most ``concurrency`` at a time.
+    
+    Args:
+        urls (iterable): URLs of Google Scholar profile pages
+        concurrency (int): Maximum number of profiles scraped at once
+        session (aiohttp.ClientSession): Session to reuse; a private one is
+            opened for the batch if omitted
+        parser (str): HTML parser backend, one of PARSERS
+        
+    Returns:
+        list: (url, result) tuples in input order, with result as returned by
+            async_scrape_profile. URLs spelling the same profile (see
+            ProfileKey) share one crawl.
+    """
+    _require_aiohttp()
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with _AsyncSession(session) as session:
+        def start(url):
+            dequeued = []
+            
+            def dequeue(_=None):
+                # Once per task, whether it starts or is cancelled while queued
+                if not dequeued:
+                    dequeued.append(True)
+                    _adjust('queue_depth', -1)
+            
+            async def scrape_one():
+                async with semaphore:
+                    dequeue()
+                    return await async_scrape_profile(url, session, parser)
+            
+            _adjust('queue_depth', 1)
+            task = asyncio.ensure_future(scrape_one())
+            task.add_done_callback(dequeue)
+            return task
+        
+        tasks = {}
+        keyed_urls = []
+        for url in urls:
+            # URLs without a user ID are kept apart under their own spelling
+            key = _profile_key(url) or url
+            if key not in tasks:
+                tasks[key] = start(url)
+            keyed_urls.append((url, key))
+        
+        await asyncio.gather(*tasks.values())
+    
+    results = []
+    seen = set()
+    for url, key in keyed_urls:
+        result = tasks[key].result()
+        results.append((url, copy.deepcopy(result) if key in seen else result))
+        seen.add(key)
+    return results
+
+
+@_instrumented('print_publications_sorted')
 def print_publications_sorted(publications):
     """
     Print publications sorted by number of citations (descending).
@@ -184,6 +2571,7 @@ def print_publications_sorted(publications):
         print()
 
 
+@_instrumented('find_undercited_publications')
 def find_undercited_publications(publications, current_year=2025):
     """
     Find publications where citations < age in years.
@@ -219,6 +2607,7 @@ def find_undercited_publications(publications, current_year=2025):
     return undercited
 
 
+@_instrumented('print_undercited_publications')
 def print_undercited_publications(undercited_pubs):
     """
     Print publications that have been cited less than their age in years.
@@ -252,14 +2641,26 @@ def print_undercited_publications(undercited_pubs):
         print()
 
 
-# Example usage
-if __name__ == "__main__":
-    url = "https://scholar.google.de/citations?user=6ImtercAAAAJ&hl=de&oi=ao"
+def print_report(url, parser=DEFAULT_PARSER, prefetch=0, current_year=2025):
+    """
+    Scrape a profile and print its metrics, publications and undercited papers.
     
+    Args:
+        url (str): URL of the Google Scholar profile page
+        parser (str): HTML parser backend, one of PARSERS
+        prefetch (int): Pages fetched ahead, see scrape_profile
+        current_year (int): Current year for age calculation
+    """
     print(f"Scraping Google Scholar profile: {url}\n")
     
-    # Get h-index and metrics
-    metrics = get_h_index(url)
+    # Get h-index, metrics and all publications in one pass over the pages
+    profile = scrape_profile(url, parser=parser, prefetch=prefetch)
+    
+    if "error" in profile:
+        metrics = publications = profile
+    else:
+        metrics = profile['metrics']
+        publications = profile['publications']
     
     if "error" in metrics:
         print(f"Error getting metrics: {metrics['error']}")
@@ -276,15 +2677,11 @@ if __name__ == "__main__":
         print(f"\ni10-index (All): {metrics.get('i10_index_all', 'N/A')}")
         print(f"i10-index (Since 2020): {metrics.get('i10_index_recent', 'N/A')}")
     
-    # Get all publications
-    print("\nFetching publications...")
-    publications = get_publications(url)
-    
     # Print publications sorted by citations
     print_publications_sorted(publications)
     
     # Find and print undercited publications
-    undercited = find_undercited_publications(publications, current_year=2025)
+    undercited = find_undercited_publications(publications, current_year=current_year)
     print_undercited_publications(undercited)
     
     # Print summary statistics
@@ -300,3 +2697,90 @@ if __name__ == "__main__":
         print(f"Average Citations per Publication: {avg_citations:.2f}")
         print(f"Most Cited Publication: {publications[0]['citations']} citations" if publications else "N/A")
         print(f"Undercited Publications: {len(undercited)}")
+
+
+def _run_profiled(fn, profiler, output, top):
+    """
+    Run ``fn`` under a profiler, save the results and print the hot spots.
+    
+    Both profilers measure wall-clock time of the calling thread, so time
+    spent waiting on the network shows up (in socket reads) next to the
+    CPU time spent parsing.
+    
+    Args:
+        fn (callable): Work to profile
+        profiler (str): 'cprofile', 'pyinstrument' or 'auto' (pyinstrument
+            when installed, cProfile otherwise)
+        output (str): File for the results, or None for a default name
+        top (int): Number of functions in the printed summary
+    """
+    if profiler == 'auto':
+        profiler = 'pyinstrument' if pyinstrument is not None else 'cprofile'
+    
+    if profiler == 'pyinstrument':
+        if pyinstrument is None:
+            raise ImportError("The 'pyinstrument' profiler requires pyinstrument")
+        sampler = pyinstrument.Profiler()
+        sampler.start()
+        try:
+            fn()
+        finally:
+            sampler.stop()
+        output = output or 'scholar_scraper_profile.html'
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(sampler.output_html())
+        print(sampler.output_text(unicode=True, color=False), file=sys.stderr)
+    else:
+        profile = cProfile.Profile()
+        try:
+            profile.runcall(fn)
+        finally:
+            output = output or 'scholar_scraper.prof'
+            profile.dump_stats(output)
+        stats = pstats.Stats(profile, stream=sys.stderr)
+        stats.sort_stats('tottime').print_stats(top)
+        stats.sort_stats('cumulative').print_stats(top)
+    
+    print(f"Profile written to {output}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Print citation metrics and publications of a Google Scholar profile.")
+    parser.add_argument('url', nargs='?',
+                        default="https://scholar.google.de/citations?user=6ImtercAAAAJ&hl=de&oi=ao",
+                        help="URL of the Google Scholar profile page")
+    parser.add_argument('--parser', choices=PARSERS, default=DEFAULT_PARSER,
+                        help="HTML parser backend")
+    parser.add_argument('--prefetch', type=int, default=0,
+                        help="pages fetched ahead of the one being parsed")
+    parser.add_argument('--current-year', type=int, default=2025,
+                        help="year used to compute publication ages")
+    parser.add_argument('--profile', action='store_true',
+                        help="run under a profiler and report where the time went")
+    parser.add_argument('--profiler', choices=('auto', 'cprofile', 'pyinstrument'),
+                        default='auto',
+                        help="profiler for --profile; auto uses pyinstrument when installed")
+    parser.add_argument('--profile-output', metavar='PATH',
+                        help="file for the profile (cProfile stats or pyinstrument HTML)")
+    parser.add_argument('--top', type=int, default=25,
+                        help="number of functions in the profile summary")
+    args = parser.parse_args(argv)
+    
+    def run():
+        print_report(args.url, args.parser, args.prefetch, args.current_year)
+    
+    if args.profile:
+        # Both profilers only sample the main thread, not the prefetch workers
+        if args.prefetch:
+            print("Note: pages fetched by prefetch threads are not profiled; use --prefetch 0 "
+                  "to profile fetching and parsing", file=sys.stderr)
+        _run_profiled(run, args.profiler, args.profile_output, args.top)
+    else:
+        run()
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
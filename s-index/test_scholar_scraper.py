@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import mock_scholar
+import scholar_scraper as scraper
+from mock_scholar import MockScholarServer
+
+
+@pytest.fixture
+def server():
+    base_url = scraper.SCHOLAR_CITATIONS_URL
+    with MockScholarServer(latency=0.05) as srv:
+        scraper.configure(base_url=srv.base_url, cache=None, result_cache=None,
+                          rate_limiter=None, retry_policy=None, hedge_policy=None,
+                          checkpoint=None)
+        yield srv
+    scraper.configure(base_url=base_url, rate_limiter=scraper.RateLimiter(),
+                      retry_policy=scraper.RetryPolicy())
+
+
+def _url(server, user_id, size):
+    server.profiles[user_id] = size
+    return f"{server.base_url}?user={user_id}&hl=en"
+
+
+def _run_concurrently(*calls):
+    results = [None] * len(calls)
+    barrier = threading.Barrier(len(calls))
+
+    def run(i, delay, fn):
+        barrier.wait()
+        time.sleep(delay)
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i, delay, fn))
+               for i, (delay, fn) in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_single_flight_shares_one_crawl(server):
+    url = _url(server, 'shared', 300)
+
+    results = _run_concurrently(*[(0, lambda: scraper.get_publications(url))] * 4)
+
+    assert server.requests == 3
+    assert all(len(result) == 300 for result in results)
+    assert all(result == results[0] for result in results)
+    # Every caller owns its result, down to the publication dicts
+    assert len({id(result) for result in results}) == 4
+    assert len({id(result[0]) for result in results}) == 4
+
+
+def test_single_flight_does_not_share_a_shorter_deadline(server):
+    url = _url(server, 'deadlines', 2000)
+
+    short, full = _run_concurrently((0, lambda: scraper.get_publications(url, deadline=0.3)),
+                                    (0.1, lambda: scraper.get_publications(url)))
+
+    assert short.partial
+    assert not full.partial
+    assert len(full) == 2000
+
+
+def test_deadline_returns_partial_publications(server):
+    url = _url(server, 'slow', 2000)
+
+    publications = scraper.get_publications(url, deadline=0.3)
+
+    assert publications.partial
+    assert 0 < len(publications) < 2000
+    assert len(publications) % scraper.PAGE_SIZE == 0
+    assert publications.parser == scraper.DEFAULT_PARSER
+
+
+def test_checkpoint_resumes_after_failed_page(server, tmp_path, monkeypatch):
+    checkpoint = scraper.CrawlCheckpoint(str(tmp_path / 'checkpoints.sqlite3'))
+    scraper.configure(checkpoint=checkpoint)
+    url = _url(server, 'resumed', 500)
+    render = mock_scholar.render_profile_page
+    failures = []
+
+    def failing_render(profile, start=0, *args, **kwargs):
+        if start == 300 and not failures:
+            failures.append(start)
+            raise RuntimeError("injected failure")
+        return render(profile, start, *args, **kwargs)
+
+    monkeypatch.setattr(mock_scholar, 'render_profile_page', failing_render)
+
+    assert 'error' in scraper.get_publications(url)
+    assert server.requests == 4
+    profile = scraper.ProfileKey.from_url(url)
+    assert [start for start, _, _ in checkpoint.load(profile)] == [0, 100, 200]
+
+    publications = scraper.get_publications(url)
+
+    # Only the failed page and the one after it are fetched again
+    assert server.requests == 6
+    assert len(publications) == 500
+    assert checkpoint.load(profile) == []
+
+
+def test_async_waiter_survives_cancelled_leader(server):
+    url = _url(server, 'cancelled', 300)
+
+    async def crawl():
+        leader = asyncio.ensure_future(scraper.async_get_publications(url))
+        await asyncio.sleep(0.02)
+        waiter = asyncio.ensure_future(scraper.async_get_publications(url))
+        await asyncio.sleep(0.02)
+        leader.cancel()
+        return await waiter
+
+    publications = asyncio.run(crawl())
+
+    assert len(publications) == 300
+    assert server.requests == 3
+
+
+def test_rate_limiter_backs_off_and_recovers():
+    limiter = scraper.RateLimiter(rate=10.0, burst=1, recovery=0.5)
+    assert limiter.reserve('host') == 0.0
+
+    limiter.throttled('host', retry_after=0.5)
+
+    assert limiter.current_rate('host') == 5.0
+    assert limiter.reserve('host') == pytest.approx(0.5, abs=0.05)
+    assert not limiter.try_acquire('host')
+
+    limiter.succeeded('host')
+
+    assert limiter.current_rate('host') == 10.0